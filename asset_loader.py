@@ -0,0 +1,143 @@
+# asset_loader.py
+"""
+Cached image loaders shared by both game windows.
+Every asset is decoded, resized and turned into a PhotoImage once per process,
+however many windows are opened.
+"""
+import functools
+import os
+from PIL import Image, ImageColor, ImageDraw, ImageTk
+
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+@functools.lru_cache(maxsize=8)
+def open_source(filename):
+    """Decode an asset once at full resolution, or None if it is missing or unreadable."""
+    path = os.path.join(ASSETS_DIR, filename)
+    if os.path.exists(path):
+        try:
+            img = Image.open(path)
+            # Only carry an alpha channel for art that actually has transparency
+            has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+            return img.convert("RGBA" if has_alpha else "RGB")
+        except Exception as e:
+            print(f"Could not load image {path}: {e}")
+            return None
+    else:
+        print(f"Missing asset: {path}")
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def open_tile(filename, size):
+    """An asset resized to one cell; each size is resampled from the decoded source only once."""
+    img = open_source(filename)
+    if img is None or img.size == (size, size):
+        return img
+    # Pillow's BILINEAR still averages over the whole footprint when shrinking,
+    # so the sprites stay smooth at about a third of the LANCZOS cost
+    return img.resize((size, size), Image.BILINEAR)
+
+
+@functools.lru_cache(maxsize=16)
+def load_tile(filename, size):
+    """Shared PhotoImage for a cell-sized asset."""
+    img = open_tile(filename, size)
+    return ImageTk.PhotoImage(img) if img else None
+
+
+@functools.lru_cache(maxsize=16)
+def load_water_sprite(filename, size):
+    """
+    Shared PhotoImage for a cell-sized sprite drawn over water. Its soft edges are pre-blended
+    onto the water tile and only fully transparent pixels stay see-through, so Tk can clip it
+    with a plain mask instead of alpha blending it on every redraw.
+    """
+    img = open_tile(filename, size)
+    if img is None or img.mode != "RGBA":
+        return load_tile(filename, size)
+    water = open_tile("water.png", size)
+    base = water.convert("RGBA") if water else Image.new("RGBA", img.size, "#004466")
+    flat = Image.alpha_composite(base, img)
+    flat.putalpha(img.getchannel("A").point(lambda a: 255 if a else 0))
+    return ImageTk.PhotoImage(flat)
+
+
+@functools.lru_cache(maxsize=4)
+def load_board(grid_size, cell_size):
+    """
+    Render the water tiles and grid lines once into a full board image,
+    so each grid is a single canvas item (clicks map via event.x // cell_size).
+    """
+    board_size = grid_size * cell_size
+    # Opaque board on the canvas background colour, so Tk can blit it without alpha blending
+    board = Image.new("RGB", (board_size, board_size), "#004466")
+    water = open_tile("water.png", cell_size)
+    if water:
+        mask = water if water.mode == "RGBA" else None
+        for i in range(grid_size):
+            for j in range(grid_size):
+                board.paste(water, (j * cell_size, i * cell_size), mask)
+    draw = ImageDraw.Draw(board)
+    for k in range(grid_size + 1):
+        offset = min(k * cell_size, board_size - 1)
+        draw.line([(offset, 0), (offset, board_size)], fill="#88ccff")
+        draw.line([(0, offset), (board_size, offset)], fill="#88ccff")
+    return ImageTk.PhotoImage(board)
+
+
+@functools.lru_cache(maxsize=32)
+def load_pulse(rows, cols, cell_size, fill, outline, alpha):
+    """
+    Render a targeting pulse spanning rows x cols cells as one translucent image,
+    so a whole row/column/square pattern is a single canvas item.
+    """
+    img = Image.new("RGBA", (cols * cell_size, rows * cell_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    fill_rgba = ImageColor.getrgb(fill) + (alpha,)
+    for i in range(rows):
+        for j in range(cols):
+            cx = j * cell_size + cell_size // 2
+            cy = i * cell_size + cell_size // 2
+            draw.rectangle([cx - 20, cy - 20, cx + 20, cy + 20], fill=fill_rgba, outline=outline, width=2)
+    return ImageTk.PhotoImage(img)
+
+
+@functools.lru_cache(maxsize=4)
+def load_x_mark(cell_size):
+    """Red hit X drawn once into a transparent cell-sized image, placed as one item per hit."""
+    img = Image.new("RGBA", (cell_size, cell_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    c, x_size = cell_size // 2, 20
+    draw.line([(c - x_size, c - x_size), (c + x_size, c + x_size)], fill="#ff0000", width=4)
+    draw.line([(c - x_size, c + x_size), (c + x_size, c - x_size)], fill="#ff0000", width=4)
+    return ImageTk.PhotoImage(img)
+
+
+# EV scan marker styles: (shape, half-size, outline colour, line width)
+_SCAN_MARKER_STYLES = {
+    "detected": ("rectangle", 20, "#00ff00", 2),
+    "interaction": ("ellipse", 15, "#ffaa00", 2),
+    "noise": ("rectangle", 8, "#888888", 1),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def load_scan_marker(kind, cells, cell_size):
+    """
+    Render an EV scan marker for every (row, col) offset in cells into one
+    transparent image, so a scanned region is a single canvas item.
+    """
+    shape, half, outline, width = _SCAN_MARKER_STYLES[kind]
+    rows = max(r for r, _ in cells) + 1
+    cols = max(c for _, c in cells) + 1
+    img = Image.new("RGBA", (cols * cell_size, rows * cell_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw_shape = draw.ellipse if shape == "ellipse" else draw.rectangle
+    for r, c in cells:
+        cx = c * cell_size + cell_size // 2
+        cy = r * cell_size + cell_size // 2
+        draw_shape([cx - half, cy - half, cx + half, cy + half], outline=outline, width=width)
+    return ImageTk.PhotoImage(img)
@@ -33,6 +33,10 @@ class GameController:
         """Get current game statistics."""
         return self.game.get_game_stats()
     
+    def receive_hit(self, row, col):
+        """Record a direct hit on a ship at (row, col)."""
+        self.game.found_ships.add((row, col))
+    
     def get_ship_positions(self):
         """Get all ship positions (for debugging)."""
         return self.game.ship_positions
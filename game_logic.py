@@ -14,6 +14,11 @@ class QuantumBattleshipGame:
         self.grid_size = grid_size
         self.num_ships = num_ships
         self.found_ships = set()
+        # Qubits needed to index every cell; fixed for the board, so computed once
+        self.n_qubits = math.ceil(math.log2(grid_size * grid_size))
+        # Index <-> (row, col) lookup tables; off-board coordinates have no entry
+        self._coord_table = tuple(divmod(index, grid_size) for index in range(grid_size * grid_size))
+        self._index_table = {coords: index for index, coords in enumerate(self._coord_table)}
         
         if auto_place_ships:
             self.ship_positions = self.generate_random_ships()
@@ -22,20 +27,15 @@ class QuantumBattleshipGame:
         
     def generate_random_ships(self):
         """Generate random ship positions ensuring no duplicates."""
-        ships = set()
-        max_attempts = self.grid_size * self.grid_size * 2
-        attempts = 0
+        total_cells = self.grid_size * self.grid_size
+        num_ships = min(self.num_ships, total_cells)
         
-        while len(ships) < self.num_ships and attempts < max_attempts:
-            row = random.randint(0, self.grid_size - 1)
-            col = random.randint(0, self.grid_size - 1)
-            ships.add((row, col))
-            attempts += 1
+        if num_ships < self.num_ships:
+            print(f"Warning: Could only place {num_ships} ships out of {self.num_ships} requested")
         
-        if len(ships) < self.num_ships:
-            print(f"Warning: Could only place {len(ships)} ships out of {self.num_ships} requested")
-        
-        return list(ships)
+        # Sample distinct cell indices in one draw instead of retrying on collisions;
+        # returned as a set so hit checks against the fleet are O(1)
+        return {self.index_to_coords(index) for index in random.sample(range(total_cells), num_ships)}
     
     def coords_to_index(self, x, y):
         """Convert (row, col) coordinates to linear index."""
@@ -43,15 +43,17 @@ class QuantumBattleshipGame:
     
     def index_to_coords(self, index):
         """Convert linear index back to (row, col) coordinates."""
+        # The table only covers on-board cells; a measured basis state past the board
+        # (grid_size**2 not a power of two) still maps to off-board coordinates
+        if 0 <= index < len(self._coord_table):
+            return self._coord_table[index]
         return divmod(index, self.grid_size)
     
     def coords_to_indices(self, coords):
         """Convert list of coordinates to list of indices."""
-        return [
-            self.coords_to_index(x, y)
-            for x, y in coords
-            if 0 <= x < self.grid_size and 0 <= y < self.grid_size
-        ]
+        # A table lookup doubles as the bounds check
+        index_table = self._index_table
+        return [index_table[cell] for cell in coords if cell in index_table]
     
     def get_region_coords(self, row, col, selection_mode, region_size=2):
         """Get all coordinates for a selected region based on mode."""
@@ -63,11 +65,11 @@ class QuantumBattleshipGame:
                 region.append((row, col))
         
         elif selection_mode == "square":
-            for dx in range(region_size):
-                for dy in range(region_size):
-                    rr, cc = row + dx, col + dy
-                    if 0 <= rr < self.grid_size and 0 <= cc < self.grid_size:
-                        region.append((rr, cc))
+            # Clip the square's row/column ranges to the board once instead of
+            # bounds-checking every cell
+            rows = range(max(row, 0), min(row + region_size, self.grid_size))
+            cols = range(max(col, 0), min(col + region_size, self.grid_size))
+            region = [(rr, cc) for rr in rows for cc in cols]
         
         elif selection_mode == "row":
             for cc in range(self.grid_size):
@@ -87,27 +89,24 @@ class QuantumBattleshipGame:
         if not selected_region:
             return {"error": "No region selected"}
         
-        # Check if region only contains already-found ships
-        if all(cell in self.found_ships for cell in selected_region):
+        # Drop already-found cells first, so a region of only found ships
+        # returns before any index or ship lists are built
+        unscanned = [cell for cell in selected_region if cell not in self.found_ships]
+        if not unscanned:
             return {"error": "Region already contains discovered ships"}
         
-        # Convert to indices and filter out found ships
-        region_indices = self.coords_to_indices(selected_region)
-        # Find which ships (if any) are in the target region
-        remaining_ships = [s for s in self.ship_positions if s not in self.found_ships]
-        ship_indices = self.coords_to_indices(remaining_ships)
-        ships_in_region = [s for s in ship_indices if s in region_indices]
-        
-        # Remove already found ships from search space
-        region_indices = [
-            idx for idx in region_indices
-            if self.index_to_coords(idx) not in self.found_ships
-        ]
+        # Search space: the unscanned cells that are on the board
+        region_indices = self.coords_to_indices(unscanned)
         
         if not region_indices:
             return {"error": "You already scanned this area"}
         
-        n_qubits = math.ceil(math.log2(self.grid_size * self.grid_size))
+        # Ships still hidden in the target region (found cells were dropped above)
+        coord_table = self._coord_table
+        ship_positions = self.ship_positions
+        ships_in_region = [idx for idx in region_indices if coord_table[idx] in ship_positions]
+        
+        n_qubits = self.n_qubits
         
         # Execute quantum shot
         if ships_in_region:
@@ -157,7 +156,7 @@ class QuantumBattleshipGame:
     
     def is_game_won(self):
         """Check if all ships have been found."""
-        return set(self.ship_positions) == self.found_ships
+        return self.ship_positions == self.found_ships
     
     def get_game_stats(self):
         """Get current game statistics."""
@@ -167,7 +166,7 @@ class QuantumBattleshipGame:
             "ships_remaining": len(self.ship_positions) - len(self.found_ships),
             "grid_size": f"{self.grid_size}x{self.grid_size}",
             "total_cells": self.grid_size * self.grid_size,
-            "qubits_needed": math.ceil(math.log2(self.grid_size * self.grid_size))
+            "qubits_needed": self.n_qubits
         }
     
     def print_debug_info(self):
@@ -1,34 +1,54 @@
+from __future__ import annotations
+
+import functools
 import math
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from typing import TYPE_CHECKING
+
+# qiskit takes a noticeable fraction of a second to import, so it is loaded on
+# first use rather than whenever the game modules are imported
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 
 # -------------------------------------------------------------------
 # 🧠 Oracle — marks one or more hidden ships (target states)
 # -------------------------------------------------------------------
+def _gray_rank(index: int) -> int:
+    """Position of index in the reflected Gray code sequence."""
+    rank = 0
+    while index:
+        rank ^= index
+        index >>= 1
+    return rank
+
+
 def build_oracle(n_qubits: int, target_indices: list[int]) -> QuantumCircuit:
     """
     Oracle that flips the phase of each marked (ship) state.
     """
-    qc = QuantumCircuit(n_qubits)
+    from qiskit import QuantumCircuit
 
-    for target_index in target_indices:
-        binary_target = format(target_index, f'0{n_qubits}b')
+    qc = QuantumCircuit(n_qubits)
+    controls = list(range(n_qubits - 1))
+    all_bits = (1 << n_qubits) - 1
 
+    # The per-target phase flips commute, so visit targets in Gray code order and only
+    # toggle the qubits whose X state differs from the previous target (qubit i is bit i)
+    flipped = 0
+    for target_index in sorted(target_indices, key=_gray_rank):
         # Flip qubits for bits that are 0 so that the mcx hits only |target>
-        for i, bit in enumerate(reversed(binary_target)):
-            if bit == '0':
-                qc.x(i)
+        zero_mask = ~target_index & all_bits
+        diff = flipped ^ zero_mask
+        if diff:
+            qc.x([i for i in range(n_qubits) if diff >> i & 1])
+        flipped = zero_mask
 
-        # Multi-controlled Z (implemented as H–MCX–H on the last qubit)
-        qc.h(n_qubits - 1)
-        qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-        qc.h(n_qubits - 1)
+        # Multi-controlled Z as a single pi phase gate on the last qubit
+        qc.mcp(math.pi, controls, n_qubits - 1)
 
-        # Uncompute the X gates
-        for i, bit in enumerate(reversed(binary_target)):
-            if bit == '0':
-                qc.x(i)
+    # Uncompute the X gates still applied after the last target
+    if flipped:
+        qc.x([i for i in range(n_qubits) if flipped >> i & 1])
 
     return qc
 
@@ -37,17 +57,28 @@ def build_oracle(n_qubits: int, target_indices: list[int]) -> QuantumCircuit:
 # 💫 Diffuser (inversion about the mean)
 # -------------------------------------------------------------------
 def build_diffuser(n_qubits: int) -> QuantumCircuit:
+    from qiskit import QuantumCircuit
+
     qc = QuantumCircuit(n_qubits)
     qc.h(range(n_qubits))
     qc.x(range(n_qubits))
-    qc.h(n_qubits - 1)
-    qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-    qc.h(n_qubits - 1)
+    qc.mcp(math.pi, list(range(n_qubits - 1)), n_qubits - 1)
     qc.x(range(n_qubits))
     qc.h(range(n_qubits))
     return qc
 
 
+# -------------------------------------------------------------------
+# ♻️ One Grover iteration (oracle + diffuser), built once per target set
+# -------------------------------------------------------------------
+@functools.lru_cache(maxsize=64)
+def _grover_iteration(n_qubits: int, targets: tuple[int, ...]) -> QuantumCircuit:
+    """Cached oracle + diffuser for sorted targets; shared, so callers must not mutate it."""
+    iteration = build_oracle(n_qubits, targets)
+    iteration.compose(build_diffuser(n_qubits), inplace=True)
+    return iteration
+
+
 # -------------------------------------------------------------------
 # 🚀 Run Grover’s algorithm for one shot on possibly multiple ships
 # -------------------------------------------------------------------
@@ -65,6 +96,9 @@ def grover_shot(n_qubits: int, target_indices: list[int], shots: int = 1):
     if not target_indices:
         raise ValueError("At least one target index (ship) must be provided.")
 
+    from qiskit import QuantumCircuit
+    from qiskit_aer import AerSimulator
+
     M = len(target_indices)            # number of marked states
     N = 2 ** n_qubits                  # total states
 
@@ -72,15 +106,14 @@ def grover_shot(n_qubits: int, target_indices: list[int], shots: int = 1):
     n_iterations = max(1, int(math.floor((math.pi / 4) * math.sqrt(N / M))))
 
     # --- Build the quantum circuit ---
-    oracle = build_oracle(n_qubits, target_indices)
-    diffuser = build_diffuser(n_qubits)
+    # Repeat shots at the same ships reuse the iteration circuit instead of rebuilding it
+    iteration = _grover_iteration(n_qubits, tuple(sorted(target_indices)))
 
     qc = QuantumCircuit(n_qubits)
     qc.h(range(n_qubits))  # uniform superposition
 
     for _ in range(n_iterations):
-        qc.compose(oracle, inplace=True)
-        qc.compose(diffuser, inplace=True)
+        qc.compose(iteration, inplace=True)
 
     qc.measure_all()
 
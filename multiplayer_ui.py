@@ -1,10 +1,11 @@
 # multiplayer_ui.py
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
-import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from game_controller import GameController
 from quantum_weapons import QuantumGameState
+from asset_loader import load_board, load_pulse, load_scan_marker, load_tile, load_water_sprite, load_x_mark, open_tile
 
 
 class MultiplayerBattleshipUI:
@@ -13,6 +14,10 @@ class MultiplayerBattleshipUI:
     Ships are hidden during opponent turns for fair play.
     """
     
+    # Targeting mode button styles
+    _SELECTED_CFG = dict(bg="#00aa44", fg="white", relief="sunken", bd=3)
+    _UNSELECTED_CFG = dict(bg="#333366", fg="white", relief="raised", bd=2)
+    
     def __init__(self, root):
         # Track targeted squares per player for each region (dict: region tuple -> set of coords)
         self.player1_targeted_regions = {}
@@ -21,15 +26,13 @@ class MultiplayerBattleshipUI:
         self.root.title("Quantum Battleship - Local Multiplayer")
         self.root.configure(bg="#0a0a0a")
         # Configure window for better scaling
-        self.root.geometry("1300x700")  # Wider, less tall
         self.root.minsize(1100, 650)    # Minimum size fits all controls
         # Make window resizable and center it
         self.root.resizable(True, True)
-        # Center the window
-        self.root.update_idletasks()
+        # Center the window (screen size is known without flushing pending idle work)
         x = (self.root.winfo_screenwidth() // 2) - (1300 // 2)
         y = (self.root.winfo_screenheight() // 2) - (700 // 2)
-        self.root.geometry(f'1300x700+{x}+{y}')
+        self.root.geometry(f'1300x700+{x}+{y}')  # Wider, less tall
         # Game components
         self.player1_controller = GameController(grid_size=8, num_ships=8, auto_place_ships=False)
         self.player2_controller = GameController(grid_size=8, num_ships=8, auto_place_ships=False)
@@ -38,59 +41,77 @@ class MultiplayerBattleshipUI:
         # Game state
         self.grid_size = 8
         self.cell_size = 60  # Increased from 50 for bigger grids
+        # Pixel centres of each column / row (the board is square, so both tables match)
+        self._cx = [c * self.cell_size + self.cell_size // 2 for c in range(self.grid_size)]
+        self._cy = list(self._cx)
+        # Cell edges inset by 5 px, used for selection highlights on either axis
+        self._inner0 = [c * self.cell_size + 5 for c in range(self.grid_size)]
+        self._inner1 = [(c + 1) * self.cell_size - 5 for c in range(self.grid_size)]
         self.game_phase = "ship_placement"  # "ship_placement" or "battle"
         self.current_player = 1  # 1 or 2
         self.ships_to_place = 8
-        self.player1_ships = []
-        self.player2_ships = []
+        self.player1_ships = set()
+        self.player2_ships = set()
         self.selected_region = []
         self.selection_mode = "square"
         self.targeting_mode = "2x2"  # Default targeting mode
-        self.player1_hits = []  # Track ships hit by player 1
-        self.player2_hits = []  # Track ships hit by player 2
+        # Regions are a pure function of (row, col, mode) on either board - resolve them all once
+        self._region_table = {
+            (r, c, m): tuple(self.player1_controller.get_region_coords(r, c, m, 2))
+            for r in range(self.grid_size)
+            for c in range(self.grid_size)
+            for m in ("classical", "square", "row", "column")
+        }
+        self.player1_hits = set()  # Track ships hit by player 1
+        self.player2_hits = set()  # Track ships hit by player 2
         self.ready_for_battle = False
         self.turn_taken = False  # Flag to track if current player has taken their shot
         # UI elements
-        self.player1_cells = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player2_cells = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player1_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player2_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # Overlay canvas item ids per cell, flat row-major (see _i; 0 = no overlay)
+        self.player1_overlays = np.zeros(self.grid_size * self.grid_size, dtype=np.uint32)
+        self.player2_overlays = np.zeros(self.grid_size * self.grid_size, dtype=np.uint32)
         # Track shot results separately from ship placements
-        self.player1_shot_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player2_shot_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        self.player1_shot_overlays = np.zeros(self.grid_size * self.grid_size, dtype=np.uint32)
+        self.player2_shot_overlays = np.zeros(self.grid_size * self.grid_size, dtype=np.uint32)
         
         # Initialize visual effect tracking variables to prevent stuck elements
         self.target_highlights = {}
-        self.targeting_animation_overlays = []
+        self._highlight_canvas = None  # Board the current target highlights are drawn on
+        self._target_pools = {}  # canvas -> pooled highlight rectangles, one per cell of a row
+        self._mark_pools = {}  # canvas -> pooled (ship, x, splash) items per cell, see _i
         self.targeting_animation_step = 0
+        self._pulse_after = None  # Next step of the running targeting pulse
+        self._pulse_shot = None  # (canvas, shot_result) the running pulse will complete
+        self._focus_after = None  # Pending deferred focus restore after a dialog
+        self._mode_button = None  # Targeting mode button currently shown as selected
+        self._banner = None  # Reused non-modal notice banner (created on first use)
+        self._banner_after = None
         self.temp_revealed_ships = []
+        self.target_canvas = None  # Board the current selection / shot targets
+        self.target_controller = None
+        self.protection_visuals = {}  # (row, col) -> Zeno shield item id
+        self.detection_markers = []
+        self.interaction_markers = []
+        self.noise_markers = []
+        self._layout_after = None  # Pending throttled layout pass for <Configure> bursts
+        self._canvas_width = 0
+        self._center_x = None  # Last x applied to the content window
         
         # Load assets first
         self.load_assets()
         self.setup_ui()
 
     def load_assets(self):
-        """Load image assets for the game."""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(base_dir, "assets")
-        
-        def safe_load(filename):
-            path = os.path.join(assets_dir, filename)
-            if os.path.exists(path):
-                try:
-                    img = Image.open(path).convert("RGBA")
-                    img = img.resize((self.cell_size, self.cell_size), Image.LANCZOS)
-                    return ImageTk.PhotoImage(img)
-                except Exception as e:
-                    print(f"Could not load image {path}: {e}")
-                    return None
-            else:
-                print(f"Missing asset: {path}")
-                return None
-        
-        self.water_img = safe_load("water.png")
-        self.ship_img = safe_load("ship.png")
-        self.splash_img = safe_load("splash.png")
+        """Load image assets for the game (asset_loader decodes each once per process, shared by both windows)."""
+        # Decode and resize the start-up sprites concurrently (PIL releases the GIL while
+        # decoding); the PhotoImages themselves are still created here on the Tk thread
+        # (all three are needed up front: the marker pools are built with the grids)
+        sprites = ("ship.png", "water.png", "splash.png")
+        with ThreadPoolExecutor(max_workers=len(sprites)) as pool:
+            list(pool.map(open_tile, sprites, (self.cell_size,) * len(sprites)))
+        self.ship_img = load_tile("ship.png", self.cell_size)
+        self.splash_img = load_water_sprite("splash.png", self.cell_size)
+        self.water_board_img = load_board(self.grid_size, self.cell_size)
         
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
@@ -99,18 +120,57 @@ class MultiplayerBattleshipUI:
         elif event.num == 5 or event.delta < 0:
             self.main_canvas.yview_scroll(1, "units")
     
+    def _bind_mousewheel(self, event):
+        """Route mouse wheel events to the scroll area while the pointer is over it."""
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.root.bind_all("<Button-4>", self._on_mousewheel)  # Linux
+        self.root.bind_all("<Button-5>", self._on_mousewheel)  # Linux
+    
+    def _unbind_mousewheel(self, event):
+        """Stop routing mouse wheel events once the pointer leaves the scroll area."""
+        # Moving onto the embedded content also sends <Leave>; keep scrolling in that case
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        canvas_path = str(self.main_canvas)
+        if widget is not None and (str(widget) == canvas_path or str(widget).startswith(canvas_path + ".")):
+            return
+        self.root.unbind_all("<MouseWheel>")
+        self.root.unbind_all("<Button-4>")
+        self.root.unbind_all("<Button-5>")
+    
     def _center_content(self, event):
-        """Center the content in the canvas."""
-        canvas_width = event.width
+        """Record the new canvas width and schedule re-centering."""
+        self._canvas_width = event.width
+        self._schedule_layout()
+    
+    def _schedule_layout(self, event=None):
+        """Collapse a burst of <Configure> events into one layout pass ~16 ms after the last."""
+        if self._layout_after:
+            self.root.after_cancel(self._layout_after)
+        self._layout_after = self.root.after(16, self._apply_layout)
+    
+    def _apply_layout(self):
+        """Center the content in the canvas and refresh the scroll region."""
+        self._layout_after = None
+        canvas_width = self._canvas_width
         frame_width = self.scrollable_frame.winfo_reqwidth()
         
         if frame_width < canvas_width:
             # Center the frame if it's smaller than canvas
             x_offset = (canvas_width - frame_width) // 2
-            self.main_canvas.coords(self.canvas_window, x_offset, 0)
         else:
             # Left-align if frame is larger than canvas
-            self.main_canvas.coords(self.canvas_window, 0, 0)
+            x_offset = 0
+        
+        # Only move the window when the offset actually changed
+        if x_offset != self._center_x:
+            self._center_x = x_offset
+            self.main_canvas.coords(self.canvas_window, x_offset, 0)
+        
+        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+        
+    def _i(self, row, col):
+        """Flat index of a cell in the per-cell overlay lists."""
+        return row * self.grid_size + col
         
     def setup_ui(self):
         """Setup the complete UI with scrolling capability."""
@@ -120,10 +180,7 @@ class MultiplayerBattleshipUI:
         self.scrollable_frame = tk.Frame(self.main_canvas, bg="#0a0a0a")
         
         # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_layout)
         
         # Center the content window
         self.canvas_window = self.main_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -136,10 +193,9 @@ class MultiplayerBattleshipUI:
         self.main_canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Bind mouse wheel to scrolling
-        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.root.bind_all("<Button-4>", self._on_mousewheel)  # Linux
-        self.root.bind_all("<Button-5>", self._on_mousewheel)  # Linux
+        # Bind mouse wheel to scrolling only while the pointer is over the scroll area
+        self.main_canvas.bind("<Enter>", self._bind_mousewheel)
+        self.main_canvas.bind("<Leave>", self._unbind_mousewheel)
         
         # Title
         title_frame = tk.Frame(self.scrollable_frame, bg="#0a0a0a")
@@ -274,33 +330,57 @@ class MultiplayerBattleshipUI:
         self.player2_canvas.bind("<Button-1>", self.on_board_click)
         
         # Draw grids
-        self.draw_grid(self.player1_canvas, self.player1_cells)
-        self.draw_grid(self.player2_canvas, self.player2_cells)
+        self.draw_grid(self.player1_canvas)
+        self.draw_grid(self.player2_canvas)
         
-    def draw_grid(self, canvas, cells):
+    def draw_grid(self, canvas):
         """Draw a game grid with water background."""
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                x0, y0 = j * self.cell_size, i * self.cell_size
-                x1, y1 = x0 + self.cell_size, y0 + self.cell_size
-                
-                # Place water background image
-                if self.water_img:
-                    canvas.create_image(
-                        x0 + self.cell_size // 2,
-                        y0 + self.cell_size // 2,
-                        image=self.water_img
+        # Water and grid lines come pre-rendered in one image; everything tagged "board"
+        # lives for the whole session and survives new_game
+        canvas.create_image(0, 0, image=self.water_board_img, anchor="nw", tags="board")
+        
+        # Pooled target highlights; a region is at most one full row or column
+        self._target_pools[canvas] = [
+            canvas.create_rectangle(
+                0, 0, 1, 1, fill="#ffff00", outline="#ffaa00", width=2, stipple="gray50",
+                state="hidden", tags=("board", "target_hl")
+            )
+            for _ in range(self.grid_size)
+        ]
+        
+        # Pooled pulse image, moved over each fired pattern and hidden between shots
+        canvas.create_image(0, 0, anchor="nw", state="hidden", tags=("board", "pulse"))
+        
+        # Hidden ship, hit and miss items for every cell, revealed as shots land
+        self._mark_pools[canvas] = self._create_marker_pool(canvas)
+    
+    def _create_marker_pool(self, canvas):
+        """
+        Preallocate hidden per-cell items; columns are (ship, x, splash).
+        Images stay bound to their items for the whole session and are only shown or hidden.
+        """
+        gs = self.grid_size
+        marks = np.zeros((gs * gs, 3), dtype=np.uint32)
+        # Resolve the image lookups once for the loop
+        ship_img, splash_img = self.ship_img, self.splash_img
+        x_mark_img = load_x_mark(self.cell_size)
+        for i in range(gs):
+            for j in range(gs):
+                k = i * gs + j
+                cx = self._cx[j]
+                cy = self._cy[i]
+                if ship_img:
+                    marks[k, 0] = canvas.create_image(
+                        cx, cy, image=ship_img, state="hidden", tags=("board", "mark")
                     )
-                
-                # Create transparent rectangle for click handling
-                rect = canvas.create_rectangle(
-                    x0, y0, x1, y1,
-                    outline="#88ccff", 
-                    width=1, 
-                    fill="",
-                    stipple=""
+                marks[k, 1] = canvas.create_image(
+                    cx, cy, image=x_mark_img, state="hidden", tags=("board", "mark")
                 )
-                cells[i][j] = rect
+                if splash_img:
+                    marks[k, 2] = canvas.create_image(
+                        cx, cy, image=splash_img, state="hidden", tags=("board", "mark")
+                    )
+        return marks
                 
     def create_controls(self):
         """Create control buttons and targeting options."""
@@ -405,12 +485,9 @@ class MultiplayerBattleshipUI:
                 text=text,
                 command=lambda m=mode: self.set_targeting_mode(m),
                 font=("Helvetica", 11, "bold"),
-                bg="#333366",
-                fg="white",
                 activebackground="#4455aa",
                 activeforeground="white",
-                relief="raised",
-                bd=3,
+                **self._UNSELECTED_CFG,
                 padx=15,
                 pady=8,
                 width=12
@@ -575,26 +652,26 @@ class MultiplayerBattleshipUI:
         if pos in current_ships:
             # Remove ship
             current_ships.remove(pos)
-            if overlays[row][col]:
-                canvas.delete(overlays[row][col])
-                overlays[row][col] = None
+            if overlays[self._i(row, col)]:
+                canvas.delete(int(overlays[self._i(row, col)]))
+                overlays[self._i(row, col)] = 0
         else:
             # Add ship (if under limit)
             if len(current_ships) < 8:
-                current_ships.append(pos)
+                current_ships.add(pos)
                 # Place ship image
                 if self.ship_img:
-                    cx = col * self.cell_size + self.cell_size // 2
-                    cy = row * self.cell_size + self.cell_size // 2
-                    ship_overlay = canvas.create_image(cx, cy, image=self.ship_img)
-                    overlays[row][col] = ship_overlay
+                    cx = self._cx[col]
+                    cy = self._cy[row]
+                    ship_overlay = canvas.create_image(cx, cy, image=self.ship_img, tags="fleet")
+                    overlays[self._i(row, col)] = ship_overlay
         
         self.update_ship_counter()
         
     def handle_targeting(self, clicked_canvas, row, col):
         """Handle targeting during battle phase."""
         # Check for defense mode
-        if hasattr(self, 'targeting_mode') and self.targeting_mode == "defense":
+        if self.targeting_mode == "defense":
             # Defense mode: player clicks on own board to apply Zeno defense
             own_canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
             
@@ -614,8 +691,7 @@ class MultiplayerBattleshipUI:
         # Check if current player has already taken their turn
         if self.turn_taken:
             messagebox.showinfo("Turn Complete", "You have already taken your shot this turn!\nClick 'PASS TO PLAYER X' to continue.", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            self._restore_focus()
             return
             
         # Determine target board and controller
@@ -639,17 +715,10 @@ class MultiplayerBattleshipUI:
     def highlight_target_region(self, canvas, row, col, controller):
         """Highlight the selected targeting region."""
         # Clear previous selection highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    canvas.delete(highlight)
-        else:
-            self.target_highlights = {}
+        self._clear_target_highlights()
         
         # Get new region
-        self.selected_region = controller.get_region_coords(
-            row, col, self.selection_mode, 2
-        )
+        self.selected_region = self._region_table[(row, col, self.selection_mode)]
         self.target_canvas = canvas
         self.target_controller = controller
         
@@ -657,26 +726,32 @@ class MultiplayerBattleshipUI:
         if not self.selected_region:
             return
         
-        # Highlight new selection with yellow overlay
+        # Highlight new selection by moving pooled yellow overlays into place
+        # (one coords/itemconfigure pass, repainted by Tk once at idle)
+        pool = iter(self._target_pools[canvas])
+        # Bind the per-cell lookups once for the loop
+        gs = self.grid_size
+        inner0, inner1, shown = self._inner0, self._inner1, self.target_highlights
         for rr, cc in self.selected_region:
-            if 0 <= rr < self.grid_size and 0 <= cc < self.grid_size:
-                # Get the appropriate overlay array
-                if canvas == self.player1_canvas:
-                    overlays = self.player1_overlays
-                else:
-                    overlays = self.player2_overlays
-                    
+            if 0 <= rr < gs and 0 <= cc < gs:
                 # In multiplayer, ALWAYS highlight the entire region to prevent information leaks
                 # Don't check for existing overlays as that would reveal ship/hit locations
-                cx = cc * self.cell_size + self.cell_size // 2
-                cy = rr * self.cell_size + self.cell_size // 2
-                # Create yellow selection overlay
-                highlight = canvas.create_rectangle(
-                    cc * self.cell_size + 5, rr * self.cell_size + 5,
-                    (cc + 1) * self.cell_size - 5, (rr + 1) * self.cell_size - 5,
-                    fill="#ffff00", outline="#ffaa00", width=2, stipple="gray50"
-                )
-                self.target_highlights[(rr, cc)] = highlight
+                highlight = next(pool)
+                canvas.coords(highlight, inner0[cc], inner0[rr], inner1[cc], inner1[rr])
+                canvas.itemconfigure(highlight, state="normal")
+                shown[(rr, cc)] = highlight
+        canvas.tag_raise("target_hl")
+        self._highlight_canvas = canvas
+    
+    def _clear_target_highlights(self):
+        """Hide the pooled selection highlights on the board they were shown on."""
+        # Only the previous selection is dirty; a tag-wide reset would visit every board item
+        canvas = self._highlight_canvas
+        if canvas is not None:
+            for highlight in self.target_highlights.values():
+                canvas.itemconfigure(highlight, state="hidden")
+        self.target_highlights = {}
+        self._highlight_canvas = None
                     
     def place_ships_randomly(self):
         """Randomly place all ships for current player."""
@@ -691,21 +766,23 @@ class MultiplayerBattleshipUI:
         
     def update_ship_display(self, canvas, ships, overlays):
         """Update the visual display of ships on a board."""
-        # Clear current ship displays
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if overlays[i][j]:
-                    canvas.delete(overlays[i][j])
-                    overlays[i][j] = None
-        
-        # Show ships with images
-        for row, col in ships:
-            if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-                if self.ship_img:
-                    cx = col * self.cell_size + self.cell_size // 2
-                    cy = row * self.cell_size + self.cell_size // 2
-                    ship_overlay = canvas.create_image(cx, cy, image=self.ship_img)
-                    overlays[row][col] = ship_overlay
+        # Only touch cells whose ship state changed
+        displayed = {divmod(int(k), self.grid_size) for k in np.flatnonzero(overlays)}
+        wanted = set(ships)
+        
+        # Remove ships that are no longer placed
+        for row, col in displayed - wanted:
+            canvas.delete(int(overlays[self._i(row, col)]))
+            overlays[self._i(row, col)] = 0
+        
+        # Show newly placed ships with images
+        if self.ship_img:
+            for row, col in wanted - displayed:
+                if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
+                    cx = self._cx[col]
+                    cy = self._cy[row]
+                    ship_overlay = canvas.create_image(cx, cy, image=self.ship_img, tags="fleet")
+                    overlays[self._i(row, col)] = ship_overlay
                     
     def update_ship_counter(self):
         """Update the ship counter display."""
@@ -731,7 +808,7 @@ class MultiplayerBattleshipUI:
             self.ship_counter.config(text="Ships placed: 0/8")
             
             # Hide ships and show transition button
-            self.hide_ships(self.player1_canvas, self.player1_overlays)
+            self.hide_ships(self.player1_canvas)
             self.transition_frame.pack(pady=10)
             self.transition_btn.config(text="READY FOR PLAYER 2 SETUP")
             
@@ -740,7 +817,7 @@ class MultiplayerBattleshipUI:
             self.player2_controller.game.ship_positions = self.player2_ships
             
             # Hide Player 2's ships and show transition to battle
-            self.hide_ships(self.player2_canvas, self.player2_overlays)
+            self.hide_ships(self.player2_canvas)
             self.transition_frame.pack(pady=10)
             self.transition_btn.config(text="START BATTLE - PLAYER 1 GOES FIRST")
             self.status_label.config(text="SHIP PLACEMENT COMPLETE - READY FOR BATTLE")
@@ -754,13 +831,13 @@ class MultiplayerBattleshipUI:
         self.clear_all_visual_effects()
         
         if self.game_phase == "ship_placement":
-            if hasattr(self, 'ready_for_battle') and self.ready_for_battle:
+            if self.ready_for_battle:
                 # Start battle phase
                 self.ready_for_battle = False
                 self.start_battle()
             elif self.current_player == 2:
                 # Show Player 2's area and hide transition button temporarily
-                self.show_ships(self.player2_canvas, self.player2_ships, self.player2_overlays)
+                self.show_ships(self.player2_canvas)
                 self.transition_frame.pack_forget()
             
         elif self.game_phase == "battle":
@@ -776,8 +853,8 @@ class MultiplayerBattleshipUI:
                 
             # NEVER show ship locations in multiplayer - only hits/misses are visible
             # Keep all ships hidden for fair play
-            self.hide_ships(self.player1_canvas, self.player1_overlays)
-            self.hide_ships(self.player2_canvas, self.player2_overlays)
+            self.hide_ships(self.player1_canvas)
+            self.hide_ships(self.player2_canvas)
             
             # Hide Zeno protection visuals from opponent
             self.hide_protection_visuals_from_opponent()
@@ -786,12 +863,11 @@ class MultiplayerBattleshipUI:
         self.turn_taken = False
         
         # Handle quantum protection expiration
-        if hasattr(self, 'quantum_state'):
-            expired_positions = self.quantum_state.end_turn()
-            if expired_positions:
-                # Remove visual protection indicators for expired positions
-                for coords in expired_positions:
-                    self.remove_zeno_protection_visual(coords)
+        expired_positions = self.quantum_state.end_turn()
+        if expired_positions:
+            # Remove visual protection indicators for expired positions
+            for coords in expired_positions:
+                self.remove_zeno_protection_visual(coords)
         
         # Hide transition button and clear any target selection
         self.transition_frame.pack_forget()
@@ -800,45 +876,20 @@ class MultiplayerBattleshipUI:
         self.target_canvas = None
         
         # Reset targeting mode to default
-        if hasattr(self, 'targeting_mode'):
-            self.targeting_mode = "2x2"
+        self.targeting_mode = "2x2"
         
         # Clear target highlights properly
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    try:
-                        # Try to delete from both canvases since we don't know which one
-                        self.player1_canvas.delete(highlight)
-                    except:
-                        try:
-                            self.player2_canvas.delete(highlight)
-                        except:
-                            pass
-            self.target_highlights = {}
+        self._clear_target_highlights()
             
-    def hide_ships(self, canvas, overlays):
+    def hide_ships(self, canvas):
         """Hide original ship placements (not shot results) on a board."""
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if overlays[i][j]:
-                    # Only hide if it's not a shot result (ship image or splash from shots)
-                    # Check if this is a shot result by looking at shot overlay arrays
-                    if canvas == self.player1_canvas:
-                        is_shot_result = self.player1_shot_overlays[i][j] is not None
-                    else:
-                        is_shot_result = self.player2_shot_overlays[i][j] is not None
-                    
-                    # Only hide original ship placements, keep shot results visible
-                    if not is_shot_result:
-                        canvas.itemconfig(overlays[i][j], state="hidden")
+        # Placement images carry the "fleet" tag and shot results do not,
+        # so one tag-wide call hides the fleet and keeps shot results visible
+        canvas.itemconfig("fleet", state="hidden")
                     
-    def show_ships(self, canvas, ships, overlays):
+    def show_ships(self, canvas):
         """Show ships on a board by making them visible."""
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if overlays[i][j]:
-                    canvas.itemconfig(overlays[i][j], state="normal")
+        canvas.itemconfig("fleet", state="normal")
                     
     def start_battle(self):
         """Start the battle phase."""
@@ -864,8 +915,8 @@ class MultiplayerBattleshipUI:
         
         # IMPORTANT: In multiplayer, NEVER show opponent's ships - only hits/misses
         # Hide ALL ships for fair play - players should not see ship locations
-        self.hide_ships(self.player1_canvas, self.player1_overlays)
-        self.hide_ships(self.player2_canvas, self.player2_overlays)
+        self.hide_ships(self.player1_canvas)
+        self.hide_ships(self.player2_canvas)
         
         # Hide protection visuals from opponent
         self.hide_protection_visuals_from_opponent()
@@ -873,8 +924,7 @@ class MultiplayerBattleshipUI:
         messagebox.showinfo("Battle Begins!", "Ship placement complete! Player 1 goes first.\nClick on the enemy board to select a target region, then choose your targeting mode and fire!\n\nNote: You cannot see enemy ship locations - only your hits and misses will be revealed!", parent=self.root)
         
         # Ensure the main window stays on top and focused after dialog
-        self.root.lift()
-        self.root.focus_force()
+        self._restore_focus()
         
     def set_targeting_mode(self, mode):
         """Set the targeting mode and highlight selected button."""
@@ -886,37 +936,27 @@ class MultiplayerBattleshipUI:
         self.mode_var.set(mode)
         # Don't clear selected_region - let the user keep their target selection
         
-        # Update button appearances
-        for btn_mode, button in self.mode_buttons.items():
-            if btn_mode == mode:
-                button.config(bg="#00aa44", fg="white", relief="sunken", bd=3)
-            else:
-                button.config(bg="#333366", fg="white", relief="raised", bd=2)
+        # Update button appearances; only the previous and the new selection change
+        if self._mode_button is not None:
+            self._mode_button.config(**self._UNSELECTED_CFG)
+        self._mode_button = self.mode_buttons[mode]
+        self._mode_button.config(**self._SELECTED_CFG)
                 
         # Clear any existing target highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    # Clean up properly by using the stored canvas reference
-                    try:
-                        if hasattr(self, 'target_canvas'):
-                            self.target_canvas.delete(highlight)
-                    except:
-                        pass
-            self.target_highlights = {}
+        self._clear_target_highlights()
             
     def fire_quantum_weapon(self, weapon_type):
         """Execute player's selected quantum weapon."""
         # Save current selection before any processing that might clear it
-        saved_region = getattr(self, 'selected_region', []).copy() if hasattr(self, 'selected_region') else []
-        saved_canvas = getattr(self, 'target_canvas', None)
-        saved_controller = getattr(self, 'target_controller', None)
+        saved_region = list(self.selected_region)
+        saved_canvas = self.target_canvas
+        saved_controller = self.target_controller
         
         # Clear stuck visual effects but preserve target selection
         self.clear_all_visual_effects(preserve_selection=True)
         
         # Restore selection if it was cleared accidentally
-        if hasattr(self, 'selected_region') and not self.selected_region and saved_region:
+        if not self.selected_region and saved_region:
             self.selected_region = saved_region
             self.target_canvas = saved_canvas
             self.target_controller = saved_controller
@@ -929,39 +969,30 @@ class MultiplayerBattleshipUI:
         # Check if current player has already taken their turn
         if self.turn_taken and weapon_type != "zeno_defense":
             messagebox.showinfo("Turn Complete", "You have already taken your shot this turn!\nClick 'PASS TO PLAYER X' to continue.", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            self._restore_focus()
             return
             
         # Check if target region is selected (not needed for Zeno defense)
         if weapon_type != "zeno_defense":
-            if not hasattr(self, 'selected_region') or not self.selected_region:
+            if not self.selected_region:
                 messagebox.showwarning("No Target", "Please click on the enemy board to select a target region first!", parent=self.root)
                 return
                 
             # Validate targeting mode compatibility with weapon type
-            if hasattr(self, 'targeting_mode'):
-                if weapon_type in ["grover", "ev_scan"] and self.targeting_mode == "classical":
-                    messagebox.showwarning("Invalid Targeting", f"{weapon_type.upper()} requires a 2x2 region target, not single square. Switch to '2x2 Square' targeting mode.", parent=self.root)
-                    return
-                elif weapon_type == "classical" and self.targeting_mode != "classical":
-                    messagebox.showwarning("Invalid Targeting", "Classical shot requires single square targeting mode. Switch to 'Classical' targeting mode.", parent=self.root)
-                    return
-                
+            if weapon_type in ["grover", "ev_scan"] and self.targeting_mode == "classical":
+                messagebox.showwarning("Invalid Targeting", f"{weapon_type.upper()} requires a 2x2 region target, not single square. Switch to '2x2 Square' targeting mode.", parent=self.root)
+                return
+            elif weapon_type == "classical" and self.targeting_mode != "classical":
+                messagebox.showwarning("Invalid Targeting", "Classical shot requires single square targeting mode. Switch to 'Classical' targeting mode.", parent=self.root)
+                return
+            
             # Check if target controller is set
-            if not hasattr(self, 'target_controller') or not self.target_controller:
+            if not self.target_controller:
                 messagebox.showwarning("No Target", "Please click on the enemy board to select a target first!", parent=self.root)
                 return
         
         # Clear selection highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    try:
-                        self.target_canvas.delete(highlight)
-                    except:
-                        pass
-            self.target_highlights = {}
+        self._clear_target_highlights()
         
         # Determine region key for tracking (tuple of sorted coords)
         region_key = tuple(sorted(self.selected_region)) if weapon_type == "grover" else None
@@ -977,9 +1008,9 @@ class MultiplayerBattleshipUI:
                 return
         # Get enemy ship positions, excluding already hit ships
         if self.current_player == 1:
-            enemy_ships = [pos for pos in self.player2_ships if pos not in self.player2_hits]
+            enemy_ships = self.player2_ships - self.player2_hits
         else:
-            enemy_ships = [pos for pos in self.player1_ships if pos not in self.player1_hits]
+            enemy_ships = self.player1_ships - self.player1_hits
         
         # Execute the quantum weapon
         if weapon_type == "grover":
@@ -1058,22 +1089,17 @@ class MultiplayerBattleshipUI:
         messagebox.showinfo("Zeno Defense", 
                           f"Player {self.current_player}: Click on one of your ships to protect it with Zeno defense!", 
                           parent=self.root)
-        self.root.lift()
-        self.root.focus_force()
+        self._restore_focus()
     
     def reveal_own_ships_for_defense(self):
         """Temporarily reveal player's own ships for Zeno defense selection."""
         own_ships = self.player1_ships if self.current_player == 1 else self.player2_ships
         own_canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
         
-        # Store current revealed ships to restore later
-        if not hasattr(self, 'temp_revealed_ships'):
-            self.temp_revealed_ships = []
-        
         # Reveal own ships with a special color for defense selection
         for row, col in own_ships:
-            cx = col * self.cell_size + self.cell_size // 2
-            cy = row * self.cell_size + self.cell_size // 2
+            cx = self._cx[col]
+            cy = self._cy[row]
             
             ship_marker = own_canvas.create_oval(
                 cx - 15, cy - 15, cx + 15, cy + 15,
@@ -1083,11 +1109,10 @@ class MultiplayerBattleshipUI:
     
     def hide_revealed_ships(self):
         """Hide temporarily revealed ships after defense selection."""
-        if hasattr(self, 'temp_revealed_ships'):
-            own_canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
-            for marker in self.temp_revealed_ships:
-                own_canvas.delete(marker)
-            self.temp_revealed_ships = []
+        own_canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
+        for marker in self.temp_revealed_ships:
+            own_canvas.delete(marker)
+        self.temp_revealed_ships = []
     
     def apply_zeno_defense_to_ship(self, coords):
         """Apply Zeno defense to a specific ship coordinate."""
@@ -1112,8 +1137,7 @@ class MultiplayerBattleshipUI:
         
         # Display result and end turn
         messagebox.showinfo("Zeno Defense", f"{result['message']} (Protection lasts 1 round)", parent=self.root)
-        self.root.lift()
-        self.root.focus_force()
+        self._restore_focus()
         
         # Clear selection and end turn
         self.selected_region = []
@@ -1143,23 +1167,21 @@ class MultiplayerBattleshipUI:
         row, col = coords
         canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
         
-        cx = col * self.cell_size + self.cell_size // 2
-        cy = row * self.cell_size + self.cell_size // 2
+        cx = self._cx[col]
+        cy = self._cy[row]
         
         # Create a golden shield overlay
         shield = canvas.create_oval(
             cx - 25, cy - 25, cx + 25, cy + 25,
-            outline="#ffd700", width=3, fill="", stipple="gray25"
+            outline="#ffd700", width=3, fill="", stipple="gray25", tags="shield"
         )
         
         # Store shield for removal later
-        if not hasattr(self, 'protection_visuals'):
-            self.protection_visuals = {}
         self.protection_visuals[coords] = shield
     
     def remove_zeno_protection_visual(self, coords):
         """Remove visual indication of Zeno protection."""
-        if hasattr(self, 'protection_visuals') and coords in self.protection_visuals:
+        if coords in self.protection_visuals:
             # Determine which canvas
             canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
             try:
@@ -1175,39 +1197,9 @@ class MultiplayerBattleshipUI:
     
     def hide_protection_visuals_from_opponent(self):
         """Hide Zeno protection visuals so opponent can't see protected ship locations."""
-        if hasattr(self, 'protection_visuals'):
-            for coords, shield_visual in self.protection_visuals.items():
-                # Determine which player owns this protection
-                player1_ships = set(self.player1_ships)
-                player2_ships = set(self.player2_ships)
-                
-                if coords in player1_ships:
-                    # Player 1's protection - hide when it's Player 2's turn
-                    if self.current_player == 2:
-                        try:
-                            self.player1_canvas.itemconfig(shield_visual, state="hidden")
-                        except:
-                            pass
-                    else:
-                        # Show when it's Player 1's turn
-                        try:
-                            self.player1_canvas.itemconfig(shield_visual, state="normal")
-                        except:
-                            pass
-                            
-                elif coords in player2_ships:
-                    # Player 2's protection - hide when it's Player 1's turn
-                    if self.current_player == 1:
-                        try:
-                            self.player2_canvas.itemconfig(shield_visual, state="hidden")
-                        except:
-                            pass
-                    else:
-                        # Show when it's Player 2's turn
-                        try:
-                            self.player2_canvas.itemconfig(shield_visual, state="normal")
-                        except:
-                            pass
+        # Shields are drawn on their owner's board, so show the current player's and hide the opponent's
+        self.player1_canvas.itemconfig("shield", state="normal" if self.current_player == 1 else "hidden")
+        self.player2_canvas.itemconfig("shield", state="normal" if self.current_player == 2 else "hidden")
     
     def show_targeting_animation(self, shot_result):
         """Show visual animation of player's targeting pattern."""
@@ -1225,67 +1217,62 @@ class MultiplayerBattleshipUI:
         # Create animation overlay based on selection mode
         self.animate_targeting_pattern(self.selection_mode, target_row, target_col, shot_result)
         
+    def _show_pulse(self, canvas, cells, fill, outline, alpha, tag):
+        """Move the board's pooled pulse image over the in-bounds cells; returns its (rows, cols) span."""
+        cells = [(r, c) for r, c in cells if 0 <= r < self.grid_size and 0 <= c < self.grid_size]
+        if not cells:
+            return 0, 0
+        r0 = min(r for r, c in cells)
+        c0 = min(c for r, c in cells)
+        rows = max(r for r, c in cells) - r0 + 1
+        cols = max(c for r, c in cells) - c0 + 1
+        canvas.coords(tag, c0 * self.cell_size, r0 * self.cell_size)
+        canvas.itemconfigure(
+            tag, image=load_pulse(rows, cols, self.cell_size, fill, outline, alpha), state="normal"
+        )
+        canvas.tag_raise(tag)
+        return rows, cols
+        
     def animate_targeting_pattern(self, pattern, target_row, target_col, shot_result):
         """Animate the targeting pattern on target board."""
-        animation_cells = []
-        
-        # Define cells to highlight based on pattern
-        if pattern == "row":
-            animation_cells = [(target_row, col) for col in range(self.grid_size)]
-        elif pattern == "column":
-            animation_cells = [(row, target_col) for row in range(self.grid_size)]
-        elif pattern == "square":
-            # Highlight 2x2 area
-            for dr in range(2):
-                for dc in range(2):
-                    r, c = target_row + dr, target_col + dc
-                    if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
-                        animation_cells.append((r, c))
-        else:
-            animation_cells = [(target_row, target_col)]
+        # A single-square shot has nothing to sweep; show the result straight away
+        if pattern == "classical":
+            self.complete_targeting_shot(shot_result)
+            return
+        
+        # Row, column and 2x2 (anchored at the target) cells come from the precomputed region table
+        animation_cells = self._region_table[(target_row, target_col, pattern)]
         
         # Create red pulse animation for all players
         player_color = "#cc3333"    # Red for all players
         player_outline = "#ff0000"  # Bright red outline
         
-        self.targeting_animation_overlays = []
-        for row, col in animation_cells:
-            if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Create pulsing overlay for targeting
-                overlay = self.target_canvas.create_rectangle(
-                    cx - 20, cy - 20, cx + 20, cy + 20,
-                    fill=player_color, outline=player_outline, width=2, stipple="gray25"
-                )
-                self.targeting_animation_overlays.append(overlay)
+        # The whole pattern is the board's pooled "pulse" image, so each pulse step is one canvas call
+        canvas = self.target_canvas
+        self._show_pulse(canvas, animation_cells, player_color, player_outline, 64, "pulse")
         
         # Start pulsing animation
         self.targeting_animation_step = 0
-        self.targeting_pulse_animation(shot_result)
+        self._pulse_shot = (canvas, shot_result)
+        self.targeting_pulse_animation(canvas, shot_result)
     
-    def targeting_pulse_animation(self, shot_result):
-        """Create pulsing effect for targeting animation."""
+    def targeting_pulse_animation(self, canvas, shot_result):
+        """Create pulsing effect for targeting animation on the board it started on."""
         if self.targeting_animation_step < 6:  # Pulse 3 times
-            # Alternate visibility
-            if self.targeting_animation_step % 2 == 0:
-                # Show overlays
-                for overlay in self.targeting_animation_overlays:
-                    self.target_canvas.itemconfig(overlay, state="normal")
-            else:
-                # Hide overlays
-                for overlay in self.targeting_animation_overlays:
-                    self.target_canvas.itemconfig(overlay, state="hidden")
+            # Alternate visibility of every overlay in one tag-level call
+            canvas.itemconfigure(
+                "pulse", state="hidden" if self.targeting_animation_step % 2 else "normal"
+            )
             
             self.targeting_animation_step += 1
-            # Continue animation after 300ms
-            self.root.after(300, lambda: self.targeting_pulse_animation(shot_result))
+            # Continue animation after 300ms; the canvas travels with the timer, since
+            # self.target_canvas can be reset before the next step runs
+            self._pulse_after = self.root.after(300, self.targeting_pulse_animation, canvas, shot_result)
         else:
             # Animation complete - clean up and show result
-            for overlay in self.targeting_animation_overlays:
-                self.target_canvas.delete(overlay)
-            self.targeting_animation_overlays = []
+            self._pulse_after = None
+            self._pulse_shot = None
+            canvas.itemconfigure("pulse", state="hidden")
             
             # Show the actual result after animation
             self.complete_targeting_shot(shot_result)
@@ -1293,7 +1280,7 @@ class MultiplayerBattleshipUI:
     def complete_targeting_shot(self, result):
         """Complete the targeting shot after animation."""
         # Determine which overlays to use
-        if hasattr(self, 'target_canvas') and self.target_canvas:
+        if self.target_canvas:
             if self.target_canvas == self.player1_canvas:
                 overlays = self.player1_overlays
                 shot_overlays = self.player1_shot_overlays
@@ -1313,70 +1300,67 @@ class MultiplayerBattleshipUI:
         if result_type == "hit":
             # Standard Grover hit
             coords_info = f"at {result['coords']}" if result.get("coords") else ""
-            messagebox.showinfo("Grover Hit!", f"🎯 DIRECT HIT! Enemy ship destroyed {coords_info}!\n\n{result.get('message', '')}", parent=self.root)
+            text = f"🎯 DIRECT HIT! Enemy ship destroyed {coords_info}!\n\n{result.get('message', '')}"
             self.show_hit_result(result, overlays, shot_overlays)
             # Track hit ship
             if self.current_player == 1 and result.get("coords"):
-                if result["coords"] not in self.player2_hits:
-                    self.player2_hits.append(result["coords"])
+                self.player2_hits.add(result["coords"])
             elif self.current_player == 2 and result.get("coords"):
-                if result["coords"] not in self.player1_hits:
-                    self.player1_hits.append(result["coords"])
+                self.player1_hits.add(result["coords"])
             
         elif result_type == "detected":
             # EV scan successful detection - region only, no specific coordinates
             region_info = f"Region: {len(result.get('region', []))} squares scanned"
             ship_count = result.get('ship_count', 'unknown')
-            messagebox.showinfo("EV Detection!", f"🔍 SHIPS DETECTED! EV scan found {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            text = f"🔍 SHIPS DETECTED! EV scan found {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}"
             self.show_detection_result(result)
             
         elif result_type == "interaction":
             # EV scan with interaction - region affected, no specific coordinates
             region_info = f"Region: {len(result.get('region', []))} squares affected"
             ship_count = result.get('ship_count', 'unknown')
-            messagebox.showinfo("EV Interaction!", f"⚡ REGION INTERACTION! EV scan affected {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            text = f"⚡ REGION INTERACTION! EV scan affected {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}"
             self.show_interaction_result(result, overlays, shot_overlays)
             
         elif result_type == "clear":
             # EV scan - no ships detected
             region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Clear!", f"✅ REGION CLEAR! EV scan confirmed no ships in scanned area.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            text = f"✅ REGION CLEAR! EV scan confirmed no ships in scanned area.\n{region_info}\n\n{result.get('message', '')}"
             
         elif result_type == "inconclusive":
             # EV scan - inconclusive result
             region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Inconclusive", f"❓ INCONCLUSIVE! EV scan could not determine ship presence in region.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            text = f"❓ INCONCLUSIVE! EV scan could not determine ship presence in region.\n{region_info}\n\n{result.get('message', '')}"
             
         elif result_type == "noise":
             # EV scan - false positive
             region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Noise", f"📡 QUANTUM NOISE! EV scan detected interference in region.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            text = f"📡 QUANTUM NOISE! EV scan detected interference in region.\n{region_info}\n\n{result.get('message', '')}"
             self.show_noise_result(result, overlays, shot_overlays)
             
         elif result_type == "blocked":
             # Attack blocked by Zeno defense
-            messagebox.showinfo("Attack Blocked!", f"🛡️ ZENO DEFENSE! Attack blocked by quantum shield!\n\n{result.get('message', '')}", parent=self.root)
+            text = f"🛡️ ZENO DEFENSE! Attack blocked by quantum shield!\n\n{result.get('message', '')}"
             
         elif result_type == "obfuscated":
             # EV scan blocked by Zeno defense
-            messagebox.showinfo("Scan Obfuscated!", f"🌀 ZENO INTERFERENCE! EV scan blocked by quantum defense!\n\n{result.get('message', '')}", parent=self.root)
+            text = f"🌀 ZENO INTERFERENCE! EV scan blocked by quantum defense!\n\n{result.get('message', '')}"
             
         else:
             # Standard miss (Grover or other)
             coords_info = f"Measured position: {result['coords']}" if result.get("coords") else "No measurement"
-            messagebox.showinfo("Miss!", f"💧 MISS! Quantum scan found no ships.\n{coords_info}\n\n{result.get('message', '')}", parent=self.root)
+            text = f"💧 MISS! Quantum scan found no ships.\n{coords_info}\n\n{result.get('message', '')}"
             self.show_miss_result(result, overlays, shot_overlays)
         
+        # Only a hit gets a modal dialog; every other result is reported in the
+        # non-blocking banner so the next player can act straight away. The dialog
+        # comes last so the shot's board changes are painted together with it
+        if result_type == "hit":
+            messagebox.showinfo("Grover Hit!", text, parent=self.root)
+            self._restore_focus()
+        else:
+            self._show_banner(text)
+        
         # Track hit/miss for ALL Grover shots in region (both hits and misses)
         if result.get("method") == "grover" and result.get("coords") and self.selected_region:
             region_key = tuple(sorted(self.selected_region))
@@ -1388,15 +1372,11 @@ class MultiplayerBattleshipUI:
                 targeted = self.player2_targeted_regions.setdefault(region_key, set())
                 targeted.add(coord)
         
-        # Ensure window focus after dialog
-        self.root.lift()
-        self.root.focus_force()
-        
         # Clear selection
         self.selected_region = []
         
         # Check for win (only for destructive hits)
-        if result_type in ["hit", "interaction"] and hasattr(self, 'target_controller'):
+        if result_type in ["hit", "interaction"] and self.target_controller:
             if self.target_controller.is_game_won():
                 winner = "PLAYER 1" if self.current_player == 1 else "PLAYER 2"
                 messagebox.showinfo("VICTORY!", f"🏆 {winner} WINS! All enemy ships destroyed!", parent=self.root)
@@ -1406,96 +1386,59 @@ class MultiplayerBattleshipUI:
         """Show visual result for a direct hit."""
         if "coords" in result and self.ship_img:
             hit_row, hit_col = result["coords"]
-            cx = hit_col * self.cell_size + self.cell_size // 2
-            cy = hit_row * self.cell_size + self.cell_size // 2
+            k = self._i(hit_row, hit_col)
+            ship_overlay, x_mark = self._mark_pools[self.target_canvas][k, :2]
             
             # Show the ship image at the hit location
-            ship_overlay = self.target_canvas.create_image(cx, cy, image=self.ship_img)
-            overlays[hit_row][hit_col] = ship_overlay
-            shot_overlays[hit_row][hit_col] = ship_overlay
+            self.target_canvas.itemconfigure(int(ship_overlay), state="normal")
+            overlays[k] = ship_overlay
+            shot_overlays[k] = ship_overlay
             
             # Add red X over the hit ship
-            x_size = 20
-            x_mark1 = self.target_canvas.create_line(
-                cx - x_size, cy - x_size, cx + x_size, cy + x_size,
-                fill="#ff0000", width=4
-            )
-            x_mark2 = self.target_canvas.create_line(
-                cx - x_size, cy + x_size, cx + x_size, cy - x_size,
-                fill="#ff0000", width=4
-            )
+            self.target_canvas.itemconfigure(int(x_mark), state="normal")
+    
+    def _draw_scan_marker(self, kind, region):
+        """Draw the EV scan marker for a whole region as one image item and return its id."""
+        r0 = min(r for r, _ in region)
+        c0 = min(c for _, c in region)
+        cells = tuple(sorted({(r - r0, c - c0) for r, c in region}))
+        canvas = self.target_canvas
+        marker = canvas.create_image(
+            c0 * self.cell_size, r0 * self.cell_size, anchor="nw",
+            image=load_scan_marker(kind, cells, self.cell_size)
+        )
+        return marker
     
     def show_detection_result(self, result):
         """Show visual result for EV detection (region detection only, no specific coordinates)."""
         # EV scans now only detect presence in region, not specific coordinates
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show region scan indicator (not specific ship location)
-                detection_marker = self.target_canvas.create_rectangle(
-                    cx - 20, cy - 20, cx + 20, cy + 20,
-                    outline="#00ff00", width=2, fill="", stipple="gray75"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'detection_markers'):
-                    self.detection_markers = []
-                self.detection_markers.append(detection_marker)
+        if result.get("region"):
+            # Show region scan indicator (not specific ship location)
+            self.detection_markers.append(self._draw_scan_marker("detected", result["region"]))
     
     def show_interaction_result(self, result, overlays, shot_overlays):
         """Show visual result for EV interaction (region affected, not specific ships)."""
         # EV interaction affects region but doesn't pinpoint exact ship locations
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show interaction effect on region
-                interaction_mark = self.target_canvas.create_oval(
-                    cx - 15, cy - 15, cx + 15, cy + 15,
-                    outline="#ffaa00", width=2, fill="", stipple="gray50"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'interaction_markers'):
-                    self.interaction_markers = []
-                self.interaction_markers.append(interaction_mark)
+        if result.get("region"):
+            self.interaction_markers.append(self._draw_scan_marker("interaction", result["region"]))
     
     def show_noise_result(self, result, overlays, shot_overlays):
         """Show visual result for quantum noise in scanned region."""
         # EV noise affects entire scanned region, not specific coordinates
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show noise/static indicator across region
-                noise_marker = self.target_canvas.create_rectangle(
-                    cx - 8, cy - 8, cx + 8, cy + 8,
-                    outline="#888888", width=1, fill="", stipple="gray25"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'noise_markers'):
-                    self.noise_markers = []
-                self.noise_markers.append(noise_marker)
+        if result.get("region"):
+            self.noise_markers.append(self._draw_scan_marker("noise", result["region"]))
     
     def show_miss_result(self, result, overlays, shot_overlays):
         """Show visual result for a miss."""
         if "coords" in result and self.splash_img:
             miss_row, miss_col = result["coords"]
             if 0 <= miss_row < self.grid_size and 0 <= miss_col < self.grid_size:
-                if not overlays[miss_row][miss_col]:
-                    cx = miss_col * self.cell_size + self.cell_size // 2
-                    cy = miss_row * self.cell_size + self.cell_size // 2
-                    splash_overlay = self.target_canvas.create_image(cx, cy, image=self.splash_img)
-                    overlays[miss_row][miss_col] = splash_overlay
-                    shot_overlays[miss_row][miss_col] = splash_overlay
+                k = self._i(miss_row, miss_col)
+                if not overlays[k]:
+                    splash_overlay = self._mark_pools[self.target_canvas][k, 2]
+                    self.target_canvas.itemconfigure(int(splash_overlay), state="normal")
+                    overlays[k] = splash_overlay
+                    shot_overlays[k] = splash_overlay
         
     def new_game(self):
         """Start a new game."""
@@ -1505,8 +1448,10 @@ class MultiplayerBattleshipUI:
         
         self.game_phase = "ship_placement"
         self.current_player = 1
-        self.player1_ships = []
-        self.player2_ships = []
+        self.player1_ships = set()
+        self.player2_ships = set()
+        self.player1_hits = set()
+        self.player2_hits = set()
         self.selected_region = []
         self.turn_taken = False  # Reset turn flag
         self.ready_for_battle = False
@@ -1521,111 +1466,130 @@ class MultiplayerBattleshipUI:
         self.transition_frame.pack_forget()  # Hide transition button
         self.placement_frame.pack()
         
-        # Clear all overlays
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if self.player1_overlays[i][j]:
-                    self.player1_canvas.delete(self.player1_overlays[i][j])
-                    self.player1_overlays[i][j] = None
-                if self.player2_overlays[i][j]:
-                    self.player2_canvas.delete(self.player2_overlays[i][j])
-                    self.player2_overlays[i][j] = None
-                    
-        # Reset shot tracking arrays
-        self.player1_shot_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player2_shot_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # Forget overlay ids; the overlays are deleted in one call per canvas below
+        self.player1_overlays.fill(0)
+        self.player2_overlays.fill(0)
+        self.player1_shot_overlays.fill(0)
+        self.player2_shot_overlays.fill(0)
+        
+        # Forget marker ids; the markers are deleted with the overlays below
+        self.protection_visuals = {}
+        self.detection_markers = []
+        self.interaction_markers = []
+        self.noise_markers = []
+        self.temp_revealed_ships = []
         
         # Clear target highlights
-        if hasattr(self, 'target_highlights'):
-            self.target_highlights = {}
-        
-        # Redraw grids
-        self.player1_canvas.delete("all")
-        self.player2_canvas.delete("all")
-        self.draw_grid(self.player1_canvas, self.player1_cells)
-        self.draw_grid(self.player2_canvas, self.player2_cells)
+        self._clear_target_highlights()
+        
+        # Stop a targeting pulse from the old game before it reports its result
+        if self._pulse_after:
+            self.root.after_cancel(self._pulse_after)
+            self._pulse_after = None
+        self._pulse_shot = None
+        
+        # Drop every overlay and marker in one command per canvas;
+        # the board image and the highlight/pulse/marker pools ("board") are kept
+        for canvas in (self.player1_canvas, self.player2_canvas):
+            canvas.delete("!board")
+            canvas.itemconfigure("pulse", state="hidden")
+            canvas.itemconfigure("mark", state="hidden")
 
+    def _restore_focus(self):
+        """Bring the main window back to the front after a dialog, once per idle pass."""
+        if self._focus_after is None:
+            self._focus_after = self.root.after_idle(self._raise_if_unfocused)
+    
+    def _raise_if_unfocused(self):
+        """Lift and focus the main window unless one of its widgets already has focus."""
+        self._focus_after = None
+        if self.root.focus_get() is None:
+            self.root.lift()
+            self.root.focus_force()
+    
+    def _show_banner(self, text):
+        """Show a non-modal banner over the boards that hides itself after a short delay."""
+        if self._banner is None:
+            self._banner = tk.Toplevel(self.root)
+            self._banner.overrideredirect(True)
+            self._banner.configure(bg="#1a1a2e")
+            self._banner_label = tk.Label(
+                self._banner,
+                font=("Helvetica", 12, "bold"),
+                bg="#1a1a2e",
+                fg="#ffffff",
+                justify="center",
+                wraplength=460,
+                padx=20,
+                pady=12
+            )
+            self._banner_label.pack()
+        
+        self._banner_label.config(text=text)
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - self._banner_label.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + 80
+        self._banner.geometry(f"+{x}+{y}")
+        self._banner.deiconify()
+        self._banner.lift()
+        
+        # Restart the hide timer so back-to-back banners each get their full time
+        if self._banner_after:
+            self.root.after_cancel(self._banner_after)
+        self._banner_after = self.root.after(2500, self._hide_banner)
+    
+    def _hide_banner(self):
+        """Hide the banner."""
+        self._banner_after = None
+        self._banner.withdraw()
+    
+    def _finish_pending_pulse(self):
+        """Stop a running targeting pulse and show its shot's result straight away."""
+        if self._pulse_after is None:
+            return
+        self.root.after_cancel(self._pulse_after)
+        self._pulse_after = None
+        canvas, shot_result = self._pulse_shot
+        self._pulse_shot = None
+        canvas.itemconfigure("pulse", state="hidden")
+        
+        # The shot was already fired, so record and draw it on the board it targeted
+        self.target_canvas = canvas
+        self.complete_targeting_shot(shot_result)
+    
     def clear_all_visual_effects(self, preserve_selection=False):
         """Clear all temporary visual effects to prevent stuck elements."""
-        # Clear target highlights more aggressively
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    # Try deleting from both canvases to be sure
-                    for canvas in [self.player1_canvas, self.player2_canvas]:
-                        try:
-                            canvas.delete(highlight)
-                        except:
-                            pass
-            self.target_highlights = {}
+        # A pulse still running (e.g. the player passed the turn mid-animation) would
+        # otherwise fire against a reset board; resolve its shot while the state is intact
+        self._finish_pending_pulse()
+        
+        # Clear target highlights
+        self._clear_target_highlights()
         
         # Clear selection region only if not preserving it
-        if not preserve_selection and hasattr(self, 'selected_region'):
+        if not preserve_selection:
             self.selected_region = []
         
         # Reset target canvas references only if not preserving selection
         if not preserve_selection:
-            if hasattr(self, 'target_canvas'):
-                self.target_canvas = None
-            if hasattr(self, 'target_controller'):
-                self.target_controller = None
-        
-        # Clear targeting animations
-        if hasattr(self, 'targeting_animation_overlays'):
-            for overlay in self.targeting_animation_overlays:
-                if overlay:
-                    try:
-                        if hasattr(self, 'target_canvas') and self.target_canvas:
-                            self.target_canvas.delete(overlay)
-                    except:
-                        # Try both canvases if target_canvas isn't available
-                        try:
-                            self.player1_canvas.delete(overlay)
-                        except:
-                            try:
-                                self.player2_canvas.delete(overlay)
-                            except:
-                                pass
-            self.targeting_animation_overlays = []
+            self.target_canvas = None
+            self.target_controller = None
+        
+        # Clear targeting animations (whichever board they were drawn on)
+        self.player1_canvas.itemconfigure("pulse", state="hidden")
+        self.player2_canvas.itemconfigure("pulse", state="hidden")
         
         # Reset animation step counter
-        if hasattr(self, 'targeting_animation_step'):
-            self.targeting_animation_step = 0
+        self.targeting_animation_step = 0
         
         # Clear temporarily revealed ships (Zeno defense circles)
-        if hasattr(self, 'temp_revealed_ships'):
-            own_canvas = None
-            try:
-                own_canvas = self.player1_canvas if self.current_player == 1 else self.player2_canvas
-            except:
-                # If current_player is undefined, try both canvases
-                pass
-            
-            for marker in self.temp_revealed_ships:
-                if marker:
-                    try:
-                        if own_canvas:
-                            own_canvas.delete(marker)
-                        else:
-                            # Try both canvases
-                            try:
-                                self.player1_canvas.delete(marker)
-                            except:
-                                try:
-                                    self.player2_canvas.delete(marker)
-                                except:
-                                    pass
-                    except:
-                        pass
-            self.temp_revealed_ships = []
+        self.hide_revealed_ships()
         
         # Reset targeting mode to default if it's in defense mode
-        if hasattr(self, 'targeting_mode') and self.targeting_mode == "defense":
+        if self.targeting_mode == "defense":
             self.targeting_mode = "2x2"
         
         # Clear selection region
-        if hasattr(self, 'selected_region'):
-            self.selected_region = []
+        self.selected_region = []
 
 
 def main():
@@ -7,16 +7,17 @@ Implements three quantum mechanics-based weapons:
 """
 
 import numpy as np
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import Statevector
 import random
 
+# qiskit is imported inside the methods that build circuits, so importing this
+# module (e.g. from the UI at startup) does not pay for loading it
+
 
 class QuantumWeapons:
     """Quantum weapons implementation using Qiskit."""
     
     def __init__(self):
+        from qiskit_aer import AerSimulator
         self.simulator = AerSimulator()
         
     def grover_shot(self, selected_region, ship_positions, excluded_squares=None, protected_positions=None):
@@ -49,12 +50,15 @@ class QuantumWeapons:
             
         # Check if any ships are in the FULL selected region (not just available squares)
         # Grover algorithm should detect ships anywhere in the target region
-        ships_in_region = [pos for pos in ship_positions if pos in selected_region]
+        # (set lookups, so whole-row/column regions don't rescan the region per ship)
+        region_set = set(selected_region)
+        ships_in_region = [pos for pos in ship_positions if pos in region_set]
         
         if ships_in_region:
             # Ships detected in region - now target an unshot position
             # Check which ships are at unshot positions (can actually be hit)
-            hittable_ships = [pos for pos in ships_in_region if pos in available_squares]
+            available_set = set(available_squares)
+            hittable_ships = [pos for pos in ships_in_region if pos in available_set]
             
             if hittable_ships:
                 # Choose target ship from hittable ones (prefer unprotected)
@@ -117,11 +121,14 @@ class QuantumWeapons:
         Elitzur-Vaidman bomb tester implementation.
         Interaction-free measurement that can detect ships without destroying them.
         """
+        from qiskit import QuantumCircuit, transpile
+        
         # Create quantum circuit for EV bomb tester
         qc = QuantumCircuit(2, 2)
         
         # Check if there are any ships in the region (live bombs)
-        ships_in_region = [pos for pos in ship_positions if pos in selected_region]
+        region_set = set(selected_region)
+        ships_in_region = [pos for pos in ship_positions if pos in region_set]
         has_ship = len(ships_in_region) > 0
         
         # EV bomb tester circuit
@@ -209,37 +216,10 @@ class QuantumWeapons:
         Quantum Zeno effect implementation.
         Frequent measurements freeze quantum evolution, making ships harder to detect.
         """
-        # Create circuit with repeated weak measurements
-        qc = QuantumCircuit(1, 1)
-        
-        # Initial state preparation
-        qc.h(0)  # Start in superposition
-        
-        # Apply Zeno effect through repeated measurements and corrections
-        for i in range(protection_strength):
-            # Small rotation (weak interaction)
-            qc.ry(0.2, 0)
-            
-            # Measurement and immediate correction (simulating Zeno effect)
-            # In real implementation, this would be multiple weak measurements
-            qc.ry(-0.1, 0)  # Partial correction
-        
-        # Final measurement
-        qc.measure_all()
-        
-        # Execute circuit
-        job = self.simulator.run(transpile(qc, self.simulator), shots=1)
-        result = job.result()
-        counts = result.get_counts()
-        measurement = list(counts.keys())[0]
-        
-        # Zeno protection effectiveness based on measurement
-        if measurement == '0':
-            protection_level = "maximum"
-            effectiveness = 0.9  # 90% protection
-        else:
-            protection_level = "partial"
-            effectiveness = 0.6  # 60% protection
+        # Zeno defense always gives partial protection; the strength is accepted for
+        # callers but does not change the outcome
+        protection_level = "partial"
+        effectiveness = 0.6  # 60% protection
         
         return {
             "type": "protection_active",
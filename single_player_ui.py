@@ -1,11 +1,18 @@
 # single_player_ui.py
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
-import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import queue
+import threading
 from game_controller import GameController
 from ai_player import AIPlayer
 from quantum_weapons import QuantumGameState
+from asset_loader import load_board, load_pulse, load_scan_marker, load_tile, load_water_sprite, load_x_mark, open_tile
+
+
+# Bit flags for the per-cell player board state
+CELL_SHIP = 1
 
 
 class SinglePlayerBattleshipUI:
@@ -15,23 +22,48 @@ class SinglePlayerBattleshipUI:
     Right board: Enemy ships (offensive view)
     """
     
+    DIFFICULTY_NAMES = {"easy": "Easy", "medium": "Medium", "hard": "Hard"}
+    BATTLE_STATUS = {key: f"BATTLE PHASE - YOUR TURN (vs {name} AI)" for key, name in DIFFICULTY_NAMES.items()}
+    AI_POLL_MS = 50  # How often the main loop checks for the AI worker's move
+    
+    # Targeting mode button styles
+    _SELECTED_CFG = dict(bg="#00aa44", fg="white", relief="sunken", bd=3)
+    _UNSELECTED_CFG = dict(bg="#333366", fg="white", relief="raised", bd=2)
+    
+    # Banner template and board visual (method name or None) per player shot result type;
+    # unknown types are reported as a miss
+    _RESULT_TABLE = {
+        "hit": ("🎯 DIRECT HIT! Enemy ship destroyed {at_coords}!\n\n{message}", "show_hit_result"),
+        "detected": ("🔍 SHIPS DETECTED! EV scan found {ship_count} ship(s) in region!\n"
+                     "Region: {region_size} squares scanned\n\n{message}", "show_detection_result"),
+        "interaction": ("⚡ REGION INTERACTION! EV scan affected {ship_count} ship(s) in region!\n"
+                        "Region: {region_size} squares affected\n\n{message}", "show_interaction_result"),
+        "clear": ("✅ REGION CLEAR! EV scan confirmed no ships in scanned area.\n"
+                  "Region: {region_size} squares scanned\n\n{message}", None),
+        "inconclusive": ("❓ INCONCLUSIVE! EV scan could not determine ship presence in region.\n"
+                         "Region: {region_size} squares scanned\n\n{message}", None),
+        "noise": ("📡 QUANTUM NOISE! EV scan detected interference in region.\n"
+                  "Region: {region_size} squares scanned\n\n{message}", "show_noise_result"),
+        "blocked": ("🛡️ ZENO DEFENSE! Attack blocked by quantum shield!\n\n{message}", None),
+        "obfuscated": ("🌀 ZENO INTERFERENCE! EV scan blocked by quantum defense!\n\n{message}", None),
+    }
+    _DEFAULT_RESULT = ("💧 MISS! Quantum scan found no ships.\n{measured}\n\n{message}", "show_miss_result")
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Quantum Battleship - Single Player")
         self.root.configure(bg="#0a0a0a")  # Darker background for better contrast
         
         # Configure window for better scaling
-        self.root.geometry("1000x800")  # Set initial size (increased height)
         self.root.minsize(800, 600)     # Set minimum size (increased height)
         
         # Make window resizable and center it
         self.root.resizable(True, True)
         
-        # Center the window
-        self.root.update_idletasks()
+        # Center the window (screen size is known without flushing pending idle work)
         x = (self.root.winfo_screenwidth() // 2) - (1000 // 2)
         y = (self.root.winfo_screenheight() // 2) - (800 // 2)
-        self.root.geometry(f'1000x800+{x}+{y}')
+        self.root.geometry(f'1000x800+{x}+{y}')  # Initial size (increased height)
         
         # Game components
         self.player_controller = GameController(grid_size=8, num_ships=8, auto_place_ships=False)
@@ -41,22 +73,56 @@ class SinglePlayerBattleshipUI:
         # Game state
         self.grid_size = 8
         self.cell_size = 60  # Increased for better visibility
+        # Pixel centres of each column / row (the board is square, so both tables match)
+        self._cx = [c * self.cell_size + self.cell_size // 2 for c in range(self.grid_size)]
+        self._cy = list(self._cx)
+        # Cell edges inset by 5 px, used for selection highlights on either axis
+        self._inner0 = [c * self.cell_size + 5 for c in range(self.grid_size)]
+        self._inner1 = [(c + 1) * self.cell_size - 5 for c in range(self.grid_size)]
         self.game_phase = "ship_placement"  # "ship_placement" or "battle"
         self.player_turn = True
         self.ships_to_place = 8
-        self.placed_ships = []
+        self.placed_ships = set()
         
         # Weapon selection mode
         self.current_weapon = None
         self.zeno_mode = False  # Track if we're in Zeno defense mode
         
         # UI elements
-        self.player_cells = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.ai_cells = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.player_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
-        self.ai_overlays = [[None for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # Player board flags (CELL_SHIP) and enemy overlay item ids per cell,
+        # flat row-major (see _i; 0 = nothing shown)
+        self.player_board = np.zeros(self.grid_size * self.grid_size, dtype=np.uint8)
+        self.ai_overlays = np.zeros(self.grid_size * self.grid_size, dtype=np.uint32)
         self.selected_region = []
         self.selection_mode = "square"
+        self._ai_grid_drawn = False  # Enemy grid is built lazily when the battle starts
+        self._pending_highlight = None  # Latest (row, col) awaiting an idle highlight pass
+        self._highlight_after = None
+        self._banner = None  # Reused non-modal notice banner (created on first use)
+        self._banner_after = None
+        self._ai_pulse_span = (0, 0)  # (rows, cols) covered by the current AI pulse image
+        self._pulse_after = None  # Next step of the running targeting pulse
+        self._ai_moves = queue.Queue()  # (ai_player, ai_result, error) handed back by AI workers
+        self._ai_poll_after = None  # Next main-loop check for a finished AI move
+        self._focus_after = None  # Pending deferred focus restore after a dialog
+        self._mode_button = None  # Targeting mode button currently shown as selected
+        self._layout_after = None  # Pending throttled layout pass for <Configure> bursts
+        self._canvas_width = 0
+        self._center_x = None  # Last x applied to the content window
+        self.target_highlights = {}  # (row, col) -> pooled highlight id currently shown
+        self.defense_highlights = {}
+        self.protection_visuals = {}  # (row, col) -> Zeno shield item on the player board
+        self.detection_markers = []
+        self.interaction_markers = []
+        self.noise_markers = []
+        
+        # Regions are a pure function of (row, col, mode) - resolve them all once
+        self._region_table = {
+            (r, c, m): tuple(self.ai_controller.get_region_coords(r, c, m, 2))
+            for r in range(self.grid_size)
+            for c in range(self.grid_size)
+            for m in ("classical", "square", "row", "column")
+        }
         
         # Initialize quantum weapons system
         self.quantum_state = QuantumGameState()
@@ -73,38 +139,64 @@ class SinglePlayerBattleshipUI:
         elif event.num == 5 or event.delta < 0:
             self.main_canvas.yview_scroll(1, "units")
     
+    def _bind_mousewheel(self, event):
+        """Route mouse wheel events to the scroll area while the pointer is over it."""
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.root.bind_all("<Button-4>", self._on_mousewheel)  # Linux
+        self.root.bind_all("<Button-5>", self._on_mousewheel)  # Linux
+    
+    def _unbind_mousewheel(self, event):
+        """Stop routing mouse wheel events once the pointer leaves the scroll area."""
+        # Moving onto the embedded content also sends <Leave>; keep scrolling in that case
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        canvas_path = str(self.main_canvas)
+        if widget is not None and (str(widget) == canvas_path or str(widget).startswith(canvas_path + ".")):
+            return
+        self.root.unbind_all("<MouseWheel>")
+        self.root.unbind_all("<Button-4>")
+        self.root.unbind_all("<Button-5>")
+    
     def _center_content(self, event):
-        """Center the content in the canvas."""
-        canvas_width = event.width
+        """Record the new canvas width and schedule re-centering."""
+        self._canvas_width = event.width
+        self._schedule_layout()
+    
+    def _schedule_layout(self, event=None):
+        """Collapse a burst of <Configure> events into one layout pass ~16 ms after the last."""
+        if self._layout_after:
+            self.root.after_cancel(self._layout_after)
+        self._layout_after = self.root.after(16, self._apply_layout)
+    
+    def _apply_layout(self):
+        """Center the content in the canvas and refresh the scroll region."""
+        self._layout_after = None
+        canvas_width = self._canvas_width
         frame_width = self.scrollable_frame.winfo_reqwidth()
         
         if frame_width < canvas_width:
             # Center the frame if it's smaller than canvas
             x = (canvas_width - frame_width) // 2
-            self.main_canvas.coords(self.canvas_window, x, 0)
+            if x != self._center_x:
+                self._center_x = x
+                self.main_canvas.coords(self.canvas_window, x, 0)
         
-    def load_assets(self):
-        """Load image assets for the game."""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(base_dir, "assets")
-        
-        def safe_load(filename):
-            path = os.path.join(assets_dir, filename)
-            if os.path.exists(path):
-                try:
-                    img = Image.open(path).convert("RGBA")
-                    img = img.resize((self.cell_size, self.cell_size), Image.LANCZOS)
-                    return ImageTk.PhotoImage(img)
-                except Exception as e:
-                    print(f"Could not load image {path}: {e}")
-                    return None
-            else:
-                print(f"Missing asset: {path}")
-                return None
+        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
         
-        self.water_img = safe_load("water.png")
-        self.ship_img = safe_load("ship.png")
-        self.splash_img = safe_load("splash.png")
+    def _i(self, row, col):
+        """Flat index of a cell in the per-cell board arrays."""
+        return row * self.grid_size + col
+        
+    def load_assets(self):
+        """Load image assets for the game (asset_loader decodes each once per process, shared by both windows)."""
+        # Decode and resize the start-up sprites concurrently (PIL releases the GIL while
+        # decoding); the PhotoImages themselves are still created here on the Tk thread
+        # (all three are needed up front: the marker pools are built with the grids)
+        sprites = ("ship.png", "water.png", "splash.png")
+        with ThreadPoolExecutor(max_workers=len(sprites)) as pool:
+            list(pool.map(open_tile, sprites, (self.cell_size,) * len(sprites)))
+        self.ship_img = load_tile("ship.png", self.cell_size)
+        self.splash_img = load_water_sprite("splash.png", self.cell_size)
+        self.water_board_img = load_board(self.grid_size, self.cell_size)
         
     def setup_ui(self):
         """Setup the complete UI with scrolling capability."""
@@ -114,10 +206,7 @@ class SinglePlayerBattleshipUI:
         self.scrollable_frame = tk.Frame(self.main_canvas, bg="#0a0a0a")
         
         # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_layout)
         
         # Center the content window
         self.canvas_window = self.main_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
@@ -130,10 +219,9 @@ class SinglePlayerBattleshipUI:
         self.main_canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Bind mouse wheel to scrolling
-        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.root.bind_all("<Button-4>", self._on_mousewheel)  # Linux
-        self.root.bind_all("<Button-5>", self._on_mousewheel)  # Linux
+        # Bind mouse wheel to scrolling only while the pointer is over the scroll area
+        self.main_canvas.bind("<Enter>", self._bind_mousewheel)
+        self.main_canvas.bind("<Leave>", self._unbind_mousewheel)
         
         # Title
         title_frame = tk.Frame(self.scrollable_frame, bg="#0a0a0a")
@@ -300,60 +388,78 @@ class SinglePlayerBattleshipUI:
         # Initially disable AI board
         self.ai_canvas.config(state="disabled")
         
-        # Draw grids
+        # Draw the player grid now; the enemy grid is deferred until the battle phase
         self.draw_player_grid()
-        self.draw_ai_grid()
         
     def draw_player_grid(self):
         """Draw the player's defensive grid with water background."""
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                x0, y0 = j * self.cell_size, i * self.cell_size
-                x1, y1 = x0 + self.cell_size, y0 + self.cell_size
-                
-                # Place water background image
-                if self.water_img:
-                    self.player_canvas.create_image(
-                        x0 + self.cell_size // 2,
-                        y0 + self.cell_size // 2,
-                        image=self.water_img
+        # Water and grid lines come pre-rendered in one image
+        self.player_canvas.create_image(0, 0, image=self.water_board_img, anchor="nw", tags="board")
+        
+        # Pooled Zeno selection highlight (defense covers a single square)
+        self._defense_pool = [
+            self.player_canvas.create_rectangle(
+                0, 0, 1, 1, fill="#0088ff", outline="#0044aa", width=2, stipple="gray50",
+                state="hidden", tags=("board", "defense_hl")
+            )
+        ]
+        
+        # Hidden ship, hit and miss items for every cell, revealed in place as the game goes
+        self._player_marks = self._create_marker_pool(self.player_canvas)
+        
+        # Pooled pulse image, moved over each fired pattern and hidden between shots
+        self.player_canvas.create_image(0, 0, anchor="nw", state="hidden", tags=("board", "aianim"))
+    
+    def _create_marker_pool(self, canvas):
+        """
+        Preallocate hidden per-cell items; columns are (ship, x, splash).
+        Images stay bound to their items for the whole session and are only shown or hidden.
+        """
+        gs = self.grid_size
+        marks = np.zeros((gs * gs, 3), dtype=np.uint32)
+        # Resolve the image lookups once for the loop
+        ship_img, splash_img = self.ship_img, self.splash_img
+        x_mark_img = load_x_mark(self.cell_size)
+        for i in range(gs):
+            for j in range(gs):
+                k = i * gs + j
+                cx = self._cx[j]
+                cy = self._cy[i]
+                if ship_img:
+                    marks[k, 0] = canvas.create_image(
+                        cx, cy, image=ship_img, state="hidden", tags=("board", "mark")
                     )
-                
-                # Create transparent rectangle for click handling
-                rect = self.player_canvas.create_rectangle(
-                    x0, y0, x1, y1,
-                    outline="#88ccff", 
-                    width=1, 
-                    fill="",  # Transparent so water shows through
-                    stipple=""
+                marks[k, 1] = canvas.create_image(
+                    cx, cy, image=x_mark_img, state="hidden", tags=("board", "mark")
                 )
-                self.player_cells[i][j] = rect
+                if splash_img:
+                    marks[k, 2] = canvas.create_image(
+                        cx, cy, image=splash_img, state="hidden", tags=("board", "mark")
+                    )
+        return marks
                 
     def draw_ai_grid(self):
         """Draw the AI's grid for targeting with water background."""
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                x0, y0 = j * self.cell_size, i * self.cell_size
-                x1, y1 = x0 + self.cell_size, y0 + self.cell_size
-                
-                # Place water background image
-                if self.water_img:
-                    self.ai_canvas.create_image(
-                        x0 + self.cell_size // 2,
-                        y0 + self.cell_size // 2,
-                        image=self.water_img
-                    )
-                
-                # Create transparent rectangle for click handling
-                rect = self.ai_canvas.create_rectangle(
-                    x0, y0, x1, y1,
-                    outline="#88ccff", 
-                    width=1, 
-                    fill="",  # Transparent so water shows through
-                    stipple=""
-                )
-                self.ai_cells[i][j] = rect
-                
+        # Water and grid lines come pre-rendered in one image
+        self.ai_canvas.create_image(0, 0, image=self.water_board_img, anchor="nw", tags="board")
+        
+        # Hidden ship, hit and miss items for every enemy cell, revealed as shots land
+        self._ai_marks = self._create_marker_pool(self.ai_canvas)
+        
+        # Pooled target highlights; a region is at most one full row or column
+        self._target_pool = [
+            self.ai_canvas.create_rectangle(
+                0, 0, 1, 1, fill="#ffff00", outline="#ffaa00", width=2, stipple="gray50",
+                state="hidden", tags=("board", "target_hl")
+            )
+            for _ in range(self.grid_size)
+        ]
+        
+        # Pooled pulse image, moved over each fired pattern and hidden between shots
+        self.ai_canvas.create_image(0, 0, anchor="nw", state="hidden", tags=("board", "playeranim"))
+        
+        self._ai_grid_drawn = True
+        
     def create_controls(self):
         """Create control buttons and targeting options."""
         control_frame = tk.Frame(self.scrollable_frame, bg="#0a0a0a")
@@ -457,12 +563,9 @@ class SinglePlayerBattleshipUI:
                 text=text,
                 command=lambda m=mode: self.set_targeting_mode(m),
                 font=("Helvetica", 11, "bold"),
-                bg="#333366",
-                fg="white",
                 activebackground="#4455aa",
                 activeforeground="white",
-                relief="raised",
-                bd=3,
+                **self._UNSELECTED_CFG,
                 padx=12,
                 pady=8,
                 width=10
@@ -613,21 +716,13 @@ class SinglePlayerBattleshipUI:
             # Toggle ship placement
             if pos in self.placed_ships:
                 # Remove ship
-                self.placed_ships.remove(pos)
-                if self.player_overlays[row][col]:
-                    self.player_canvas.delete(self.player_overlays[row][col])
-                    self.player_overlays[row][col] = None
+                self.placed_ships.discard(pos)
             else:
                 # Add ship (if under limit)
                 if len(self.placed_ships) < 8:
-                    self.placed_ships.append(pos)
-                    # Place ship image
-                    if self.ship_img:
-                        cx = col * self.cell_size + self.cell_size // 2
-                        cy = row * self.cell_size + self.cell_size // 2
-                        ship_overlay = self.player_canvas.create_image(cx, cy, image=self.ship_img)
-                        self.player_overlays[row][col] = ship_overlay
+                    self.placed_ships.add(pos)
             
+            self.update_player_ship_display()
             self.update_ship_counter()
         
         # Zeno defense mode  
@@ -644,68 +739,66 @@ class SinglePlayerBattleshipUI:
         
         if row >= self.grid_size or col >= self.grid_size:
             return
-            
-        self.highlight_target_region(row, col)
+        
+        # Coalesce bursts of clicks into a single highlight per idle cycle
+        self._pending_highlight = (row, col)
+        if self._highlight_after is None:
+            self._highlight_after = self.root.after_idle(self._flush_highlight)
+    
+    def _flush_highlight(self):
+        """Highlight the most recently clicked target cell."""
+        self._highlight_after = None
+        pending, self._pending_highlight = self._pending_highlight, None
+        if pending is not None and self.game_phase == "battle":
+            self.highlight_target_region(*pending)
         
     def highlight_target_region(self, row, col):
         """Highlight the selected targeting region."""
-        # Clear previous selection by removing yellow highlights
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                # Remove yellow highlight if it exists
-                if hasattr(self, 'target_highlights') and (i, j) in self.target_highlights:
-                    if self.target_highlights[(i, j)]:
-                        self.ai_canvas.delete(self.target_highlights[(i, j)])
-        
-        # Initialize target highlights dict if not exists
-        if not hasattr(self, 'target_highlights'):
-            self.target_highlights = {}
-        
-        # Get new region based on targeting mode
-        if self.selection_mode == "classical":
-            # Classical mode: single square
-            self.selected_region = [(row, col)]
-        else:
-            # Quantum modes: use controller to get region
-            self.selected_region = self.ai_controller.get_region_coords(
-                row, col, self.selection_mode, 2
-            )
-        
-        # Highlight new selection with yellow overlay
+        # Clear previous selection by hiding the pooled yellow highlights
+        self._clear_target_highlights()
+        
+        # Get new region based on targeting mode; every mode, including the classical
+        # single square, was resolved up front, so there is no per-click dispatch
+        self.selected_region = self._region_table[(row, col, self.selection_mode)]
+        
+        # Highlight new selection by moving pooled yellow overlays into place
+        pool = iter(self._target_pool)
+        # Bind the per-cell lookups once for the loop
+        gs = self.grid_size
+        canvas, overlays, shown = self.ai_canvas, self.ai_overlays, self.target_highlights
+        inner0, inner1 = self._inner0, self._inner1
         for rr, cc in self.selected_region:
-            if 0 <= rr < self.grid_size and 0 <= cc < self.grid_size:
+            if 0 <= rr < gs and 0 <= cc < gs:
                 # Only highlight if not already hit/missed
-                if not self.ai_overlays[rr][cc]:
-                    cx = cc * self.cell_size + self.cell_size // 2
-                    cy = rr * self.cell_size + self.cell_size // 2
-                    # Create yellow selection overlay
-                    highlight = self.ai_canvas.create_rectangle(
-                        cc * self.cell_size + 5, rr * self.cell_size + 5,
-                        (cc + 1) * self.cell_size - 5, (rr + 1) * self.cell_size - 5,
-                        fill="#ffff00", outline="#ffaa00", width=2, stipple="gray50"
-                    )
-                    self.target_highlights[(rr, cc)] = highlight
+                if not overlays[rr * gs + cc]:
+                    highlight = next(pool)
+                    canvas.coords(highlight, inner0[cc], inner0[rr], inner1[cc], inner1[rr])
+                    canvas.itemconfigure(highlight, state="normal")
+                    shown[(rr, cc)] = highlight
+    
+    def _clear_target_highlights(self):
+        """Hide the pooled target highlights that are currently shown."""
+        # Only the previous selection is dirty; a tag-wide reset would visit every board item
+        canvas = self.ai_canvas
+        for highlight in self.target_highlights.values():
+            canvas.itemconfigure(highlight, state="hidden")
+        self.target_highlights = {}
+    
+    def _clear_defense_highlights(self):
+        """Hide the pooled defense highlight."""
+        self.player_canvas.itemconfigure("defense_hl", state="hidden")
+        self.defense_highlights = {}
                     
     def highlight_defense_region(self, row, col):
         """Highlight the selected defense region on player board."""
         # Clear previous selection
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if hasattr(self, 'defense_highlights') and (i, j) in self.defense_highlights:
-                    if self.defense_highlights[(i, j)]:
-                        self.player_canvas.delete(self.defense_highlights[(i, j)])
-        
-        # Initialize defense highlights dict if not exists
-        if not hasattr(self, 'defense_highlights'):
-            self.defense_highlights = {}
+        self._clear_defense_highlights()
         
         # Get new region for defense - SINGLE SQUARE ONLY for Zeno defense
         candidate_pos = (row, col)
 
         # Filter to only include positions where the player actually has ships
-        own_ships = set(self.player_controller.game.ship_positions)
-        
-        if candidate_pos not in own_ships:
+        if candidate_pos not in self.placed_ships:
             messagebox.showwarning("Invalid Zeno Placement", "Zeno Defense must be placed on one of your ship squares.", parent=self.root)
             self.selected_region = []
             return
@@ -716,13 +809,13 @@ class SinglePlayerBattleshipUI:
         # Highlight with blue overlay (defense) - single square
         rr, cc = candidate_pos
         if 0 <= rr < self.grid_size and 0 <= cc < self.grid_size:
-            cx = cc * self.cell_size + self.cell_size // 2
-            cy = rr * self.cell_size + self.cell_size // 2
-            highlight = self.player_canvas.create_rectangle(
-                cc * self.cell_size + 5, rr * self.cell_size + 5,
-                (cc + 1) * self.cell_size - 5, (rr + 1) * self.cell_size - 5,
-                fill="#0088ff", outline="#0044aa", width=2, stipple="gray50"
+            highlight = self._defense_pool[0]
+            self.player_canvas.coords(
+                highlight,
+                self._inner0[cc], self._inner0[rr],
+                self._inner1[cc], self._inner1[rr]
             )
+            self.player_canvas.itemconfigure(highlight, state="normal")
             self.defense_highlights[(rr, cc)] = highlight
                 
     def select_weapon(self, weapon_type):
@@ -737,15 +830,15 @@ class SinglePlayerBattleshipUI:
         if weapon_type == "grover":
             self.grover_btn.config(bg="#ff4444")
             self.zeno_mode = False
-            messagebox.showinfo("Grover Shot Selected", "📡 Select target region on enemy board and click to fire quantum shot!", parent=self.root)
+            self._show_banner("📡 Select target region on enemy board and click to fire quantum shot!")
         elif weapon_type == "ev_scan":
             self.ev_scan_btn.config(bg="#4488ff")
             self.zeno_mode = False
-            messagebox.showinfo("EV Scan Selected", "🔍 Select target region on enemy board to perform stealth reconnaissance!", parent=self.root)
+            self._show_banner("🔍 Select target region on enemy board to perform stealth reconnaissance!")
         elif weapon_type == "zeno_defense":
             self.zeno_btn.config(bg="#ffcc00")
             self.zeno_mode = True
-            messagebox.showinfo("Zeno Defense Selected", "🛡️ Select region on YOUR board to protect with quantum shield!", parent=self.root)
+            self._show_banner("🛡️ Select region on YOUR board to protect with quantum shield!")
             
         # Clear any existing selections
         self.selected_region = []
@@ -758,21 +851,20 @@ class SinglePlayerBattleshipUI:
         
     def update_player_ship_display(self):
         """Update the visual display of player ships."""
-        # Clear current ship displays
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if self.player_overlays[i][j]:
-                    self.player_canvas.delete(self.player_overlays[i][j])
-                    self.player_overlays[i][j] = None
-        
-        # Show ships with images
+        wanted = np.zeros_like(self.player_board)
         for row, col in self.placed_ships:
             if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-                if self.ship_img:
-                    cx = col * self.cell_size + self.cell_size // 2
-                    cy = row * self.cell_size + self.cell_size // 2
-                    ship_overlay = self.player_canvas.create_image(cx, cy, image=self.ship_img)
-                    self.player_overlays[row][col] = ship_overlay
+                wanted[self._i(row, col)] = CELL_SHIP
+        
+        # Only touch cells whose ship flag changed
+        changed = np.flatnonzero((self.player_board ^ wanted) & CELL_SHIP)
+        self.player_board[changed] ^= CELL_SHIP
+        
+        for k in changed:
+            ship_overlay = self._player_marks[k, 0]
+            if ship_overlay:
+                state = "normal" if self.player_board[k] & CELL_SHIP else "hidden"
+                self.player_canvas.itemconfigure(int(ship_overlay), state=state)
                 
     def update_ship_counter(self):
         """Update the ship counter display."""
@@ -784,18 +876,26 @@ class SinglePlayerBattleshipUI:
         if len(self.placed_ships) < 8:
             messagebox.showwarning("Incomplete", "Please place all 8 ships!", parent=self.root)
             return
+        
+        # Build the enemy grid on first use
+        if not self._ai_grid_drawn:
+            self.draw_ai_grid()
             
-        # Set ships in game controller
+        # Freeze the fleet for the battle phase and hand the same set to the game controller,
+        # so the per-turn ship checks stay O(1) and the UI can no longer alter the game's fleet
+        self.placed_ships = frozenset(self.placed_ships)
         self.player_controller.game.ship_positions = self.placed_ships
         
+        # Ships are fixed from here on, so stack the Zeno highlight above them once
+        self.player_canvas.tag_raise("defense_hl")
+        
         # Create AI with selected difficulty
         selected_difficulty = self.difficulty_var.get()
         self.ai_player = AIPlayer(difficulty=selected_difficulty)
         
         # Switch to battle phase
         self.game_phase = "battle"
-        difficulty_names = {"easy": "Easy", "medium": "Medium", "hard": "Hard"}
-        self.status_label.config(text=f"BATTLE PHASE - YOUR TURN (vs {difficulty_names[selected_difficulty]} AI)")
+        self.status_label.config(text=self.BATTLE_STATUS[selected_difficulty])
         
         # Hide placement controls and difficulty selector, show battle controls
         self.placement_frame.pack_forget()
@@ -808,11 +908,10 @@ class SinglePlayerBattleshipUI:
         # Hide ship counter
         self.ship_counter.pack_forget()
         
-        messagebox.showinfo("Battle Begins!", f"Ship placement complete! Facing {difficulty_names[selected_difficulty]} AI. Target the enemy fleet!", parent=self.root)
+        messagebox.showinfo("Battle Begins!", f"Ship placement complete! Facing {self.DIFFICULTY_NAMES[selected_difficulty]} AI. Target the enemy fleet!", parent=self.root)
         
         # Ensure the main window stays on top and focused after dialog
-        self.root.lift()
-        self.root.focus_force()
+        self._restore_focus()
         
     def set_targeting_mode(self, mode):
         """Set the targeting mode and highlight selected button."""
@@ -820,31 +919,14 @@ class SinglePlayerBattleshipUI:
         self.mode_var.set(mode)
         self.selected_region = []
         
-        # Update button appearances
-        for btn_mode, button in self.mode_buttons.items():
-            if btn_mode == mode:
-                # Highlight selected button
-                button.config(
-                    bg="#00aa44",
-                    fg="white",
-                    relief="sunken",
-                    bd=3
-                )
-            else:
-                # Reset unselected buttons
-                button.config(
-                    bg="#333366",
-                    fg="white", 
-                    relief="raised",
-                    bd=2
-                )
+        # Update button appearances; only the previous and the new selection change
+        if self._mode_button is not None:
+            self._mode_button.config(**self._UNSELECTED_CFG)
+        self._mode_button = self.mode_buttons[mode]
+        self._mode_button.config(**self._SELECTED_CFG)
         
         # Clear any existing target highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    self.ai_canvas.delete(highlight)
-            self.target_highlights = {}
+        self._clear_target_highlights()
                     
     def fire_quantum_weapon(self, weapon_type):
         """Execute player's quantum weapon attack."""
@@ -862,13 +944,12 @@ class SinglePlayerBattleshipUI:
                 return
                 
             # Validate targeting mode compatibility with weapon type
-            if hasattr(self, 'selection_mode'):
-                if weapon_type in ["grover", "ev_scan"] and self.selection_mode == "classical":
-                    messagebox.showwarning("Invalid Targeting", f"{weapon_type.upper()} requires a 2x2 region target, not single square. Switch to 'Square' targeting mode.", parent=self.root)
-                    return
-                elif weapon_type == "classical" and self.selection_mode != "classical":
-                    messagebox.showwarning("Invalid Targeting", "Classical shot requires single square targeting mode. Switch to 'Classical' targeting mode.", parent=self.root)
-                    return
+            if weapon_type in ["grover", "ev_scan"] and self.selection_mode == "classical":
+                messagebox.showwarning("Invalid Targeting", f"{weapon_type.upper()} requires a 2x2 region target, not single square. Switch to 'Square' targeting mode.", parent=self.root)
+                return
+            elif weapon_type == "classical" and self.selection_mode != "classical":
+                messagebox.showwarning("Invalid Targeting", "Classical shot requires single square targeting mode. Switch to 'Classical' targeting mode.", parent=self.root)
+                return
         
         # Handle classical shot
         if weapon_type == "classical":
@@ -923,11 +1004,7 @@ class SinglePlayerBattleshipUI:
         # For quantum weapons (Grover and EV scan)
         print(f"DEBUG: Using quantum weapon: {weapon_type}")
         # Clear selection highlights first
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    self.ai_canvas.delete(highlight)
-            self.target_highlights = {}
+        self._clear_target_highlights()
             
         # Get AI ship positions for quantum weapons
         ai_ships = self.ai_controller.get_ship_positions()
@@ -973,19 +1050,15 @@ class SinglePlayerBattleshipUI:
         self.selected_region = []
 
         # Clear any existing highlights
-        if hasattr(self, 'defense_highlights'):
-            for highlight in self.defense_highlights.values():
-                if highlight:
-                    self.player_canvas.delete(highlight)
-            self.defense_highlights = {}
+        self._clear_defense_highlights()
 
         messagebox.showinfo("Zeno Defense Mode", "Click on your own ships (left board) to protect them with quantum shielding.\nClick the Zeno Defense button again when ready to activate protection.", parent=self.root)
         
     def show_zeno_protection_visual(self, coords):
         """Show visual indication of Zeno protection on player's ship."""
         row, col = coords
-        cx = col * self.cell_size + self.cell_size // 2
-        cy = row * self.cell_size + self.cell_size // 2
+        cx = self._cx[col]
+        cy = self._cy[row]
         
         # Create a golden shield overlay on player's board
         shield = self.player_canvas.create_oval(
@@ -994,13 +1067,11 @@ class SinglePlayerBattleshipUI:
         )
         
         # Store shield for removal later
-        if not hasattr(self, 'protection_visuals'):
-            self.protection_visuals = {}
         self.protection_visuals[coords] = shield
     
     def remove_zeno_protection_visual(self, coords):
         """Remove visual indication of Zeno protection."""
-        if hasattr(self, 'protection_visuals') and coords in self.protection_visuals:
+        if coords in self.protection_visuals:
             try:
                 self.player_canvas.delete(self.protection_visuals[coords])
             except:
@@ -1009,19 +1080,9 @@ class SinglePlayerBattleshipUI:
         
     def clear_selections(self):
         """Clear all visual selections and reset weapon mode."""
-        # Clear target highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    self.ai_canvas.delete(highlight)
-            self.target_highlights = {}
-            
-        # Clear defense highlights  
-        if hasattr(self, 'defense_highlights'):
-            for highlight in self.defense_highlights.values():
-                if highlight:
-                    self.player_canvas.delete(highlight)
-            self.defense_highlights = {}
+        # Clear target and defense highlights
+        self._clear_target_highlights()
+        self._clear_defense_highlights()
             
         # Reset selections
         self.selected_region = []
@@ -1049,38 +1110,34 @@ class SinglePlayerBattleshipUI:
         # Create animation overlay based on selection mode
         self.animate_player_targeting_pattern(self.selection_mode, target_row, target_col, shot_result)
         
+    def _show_pulse(self, canvas, cells, fill, outline, alpha, tag):
+        """Move the board's pooled pulse image over the in-bounds cells; returns its (rows, cols) span."""
+        cells = [(r, c) for r, c in cells if 0 <= r < self.grid_size and 0 <= c < self.grid_size]
+        if not cells:
+            return 0, 0
+        r0 = min(r for r, c in cells)
+        c0 = min(c for r, c in cells)
+        rows = max(r for r, c in cells) - r0 + 1
+        cols = max(c for r, c in cells) - c0 + 1
+        canvas.coords(tag, c0 * self.cell_size, r0 * self.cell_size)
+        canvas.itemconfigure(
+            tag, image=load_pulse(rows, cols, self.cell_size, fill, outline, alpha), state="normal"
+        )
+        canvas.tag_raise(tag)
+        return rows, cols
+        
     def animate_player_targeting_pattern(self, pattern, target_row, target_col, shot_result):
         """Animate the player's targeting pattern on AI's board."""
-        animation_cells = []
-        
-        # Define cells to highlight based on pattern
-        if pattern == "row":
-            animation_cells = [(target_row, col) for col in range(self.grid_size)]
-        elif pattern == "column":
-            animation_cells = [(row, target_col) for row in range(self.grid_size)]
-        elif pattern == "square":
-            # Highlight 2x2 area
-            for dr in range(2):
-                for dc in range(2):
-                    r, c = target_row + dr, target_col + dc
-                    if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
-                        animation_cells.append((r, c))
-        else:
-            animation_cells = [(target_row, target_col)]
+        # A single-square shot has nothing to sweep; show the result straight away
+        if pattern == "classical":
+            self.complete_player_shot(shot_result)
+            return
         
-        # Create red pulse animation for player shots
-        self.player_animation_overlays = []
-        for row, col in animation_cells:
-            if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Create pulsing red overlay for player targeting
-                overlay = self.ai_canvas.create_rectangle(
-                    cx - 20, cy - 20, cx + 20, cy + 20,
-                    fill="#cc3333", outline="#ff0000", width=2, stipple="gray25"
-                )
-                self.player_animation_overlays.append(overlay)
+        # Row, column and 2x2 (anchored at the target) cells come from the precomputed region table
+        animation_cells = self._region_table[(target_row, target_col, pattern)]
+        
+        # Red pulse animation for player shots, using the pooled "playeranim" image
+        self._show_pulse(self.ai_canvas, animation_cells, "#cc3333", "#ff0000", 64, "playeranim")
         
         # Start pulsing animation
         self.player_animation_step = 0
@@ -1089,24 +1146,17 @@ class SinglePlayerBattleshipUI:
     def player_pulse_animation(self, shot_result):
         """Create pulsing effect for player targeting animation."""
         if self.player_animation_step < 6:  # Pulse 3 times
-            # Alternate visibility
-            if self.player_animation_step % 2 == 0:
-                # Show overlays
-                for overlay in self.player_animation_overlays:
-                    self.ai_canvas.itemconfig(overlay, state="normal")
-            else:
-                # Hide overlays
-                for overlay in self.player_animation_overlays:
-                    self.ai_canvas.itemconfig(overlay, state="hidden")
+            # Alternate visibility of every overlay in one tag-level call
+            self.ai_canvas.itemconfigure(
+                "playeranim", state="hidden" if self.player_animation_step % 2 else "normal"
+            )
             
             self.player_animation_step += 1
             # Continue animation after 300ms
-            self.root.after(300, lambda: self.player_pulse_animation(shot_result))
+            self._pulse_after = self.root.after(300, self.player_pulse_animation, shot_result)
         else:
             # Animation complete - clean up and show result
-            for overlay in self.player_animation_overlays:
-                self.ai_canvas.delete(overlay)
-            self.player_animation_overlays = []
+            self.ai_canvas.itemconfigure("playeranim", state="hidden")
             
             # Show the actual result after animation
             self.complete_player_shot(shot_result)
@@ -1117,59 +1167,17 @@ class SinglePlayerBattleshipUI:
         result_type = result.get("type", "miss")
         weapon_method = result.get("method", "unknown")
         
-        if result_type == "hit":
-            # Standard Grover hit
-            coords_info = f"at {result['coords']}" if result.get("coords") else ""
-            messagebox.showinfo("Grover Hit!", f"🎯 DIRECT HIT! Enemy ship destroyed {coords_info}!\n\n{result.get('message', '')}", parent=self.root)
-            self.show_hit_result(result)
-            
-        elif result_type == "detected":
-            # EV scan successful detection - region only, no specific coordinates
-            region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            ship_count = result.get('ship_count', 'unknown')
-            messagebox.showinfo("EV Detection!", f"🔍 SHIPS DETECTED! EV scan found {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.show_detection_result(result)
-            
-        elif result_type == "interaction":
-            # EV scan with interaction - region affected, no specific coordinates  
-            region_info = f"Region: {len(result.get('region', []))} squares affected"
-            ship_count = result.get('ship_count', 'unknown')
-            messagebox.showinfo("EV Interaction!", f"⚡ REGION INTERACTION! EV scan affected {ship_count} ship(s) in region!\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.show_interaction_result(result)
-            
-        elif result_type == "clear":
-            # EV scan - no ships detected
-            region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Clear!", f"✅ REGION CLEAR! EV scan confirmed no ships in scanned area.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            
-        elif result_type == "inconclusive":
-            # EV scan - inconclusive result
-            region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Inconclusive", f"❓ INCONCLUSIVE! EV scan could not determine ship presence in region.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            
-        elif result_type == "noise":
-            # EV scan - false positive  
-            region_info = f"Region: {len(result.get('region', []))} squares scanned"
-            messagebox.showinfo("EV Noise", f"📡 QUANTUM NOISE! EV scan detected interference in region.\n{region_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.show_noise_result(result)
-            
-        elif result_type == "blocked":
-            # Attack blocked by Zeno defense
-            messagebox.showinfo("Attack Blocked!", f"🛡️ ZENO DEFENSE! Attack blocked by quantum shield!\n\n{result.get('message', '')}", parent=self.root)
-            
-        elif result_type == "obfuscated":
-            # EV scan blocked by Zeno defense
-            messagebox.showinfo("Scan Obfuscated!", f"🌀 ZENO INTERFERENCE! EV scan blocked by quantum defense!\n\n{result.get('message', '')}", parent=self.root)
-            
-        else:
-            # Standard miss (Grover or other)
-            coords_info = f"Measured position: {result['coords']}" if result.get("coords") else "No measurement"
-            messagebox.showinfo("Miss!", f"💧 MISS! Quantum scan found no ships.\n{coords_info}\n\n{result.get('message', '')}", parent=self.root)
-            self.show_miss_result(result)
-        
-        # Ensure window focus after dialog
-        self.root.lift()
-        self.root.focus_force()
+        template, visual = self._RESULT_TABLE.get(result_type, self._DEFAULT_RESULT)
+        coords = result.get("coords")
+        self._show_banner(template.format(
+            message=result.get("message", ""),
+            ship_count=result.get("ship_count", "unknown"),
+            region_size=len(result.get("region", [])),
+            at_coords=f"at {coords}" if coords else "",
+            measured=f"Measured position: {coords}" if coords else "No measurement",
+        ))
+        if visual:
+            getattr(self, visual)(result)
         
         # Clear selection
         self.selected_region = []
@@ -1177,6 +1185,7 @@ class SinglePlayerBattleshipUI:
         # Check if player won (only for destructive hits)
         if result_type in ["hit", "interaction"] and self.ai_controller.is_game_won():
             messagebox.showinfo("VICTORY!", "🏆 You destroyed the enemy fleet! YOU WIN!", parent=self.root)
+            self._restore_focus()
             self.player_turn = False
             return
             
@@ -1190,106 +1199,106 @@ class SinglePlayerBattleshipUI:
         """Show visual result for a direct hit."""
         if "coords" in result and self.ship_img:
             hit_row, hit_col = result["coords"]
-            cx = hit_col * self.cell_size + self.cell_size // 2
-            cy = hit_row * self.cell_size + self.cell_size // 2
-            ship_overlay = self.ai_canvas.create_image(cx, cy, image=self.ship_img)
-            self.ai_overlays[hit_row][hit_col] = ship_overlay
+            k = self._i(hit_row, hit_col)
+            ship_overlay, x_mark = self._ai_marks[k, :2]
+            self.ai_canvas.itemconfigure(int(ship_overlay), state="normal")
+            self.ai_overlays[k] = ship_overlay
             
             # Add red X over the hit ship
-            x_size = 20
-            x_mark1 = self.ai_canvas.create_line(
-                cx - x_size, cy - x_size, cx + x_size, cy + x_size,
-                fill="#ff0000", width=4
-            )
-            x_mark2 = self.ai_canvas.create_line(
-                cx - x_size, cy + x_size, cx + x_size, cy - x_size,
-                fill="#ff0000", width=4
-            )
+            self.ai_canvas.itemconfigure(int(x_mark), state="normal")
+    
+    def _draw_scan_marker(self, kind, region):
+        """Draw the EV scan marker for a whole region as one image item and return its id."""
+        r0 = min(r for r, _ in region)
+        c0 = min(c for _, c in region)
+        cells = tuple(sorted({(r - r0, c - c0) for r, c in region}))
+        canvas = self.ai_canvas
+        marker = canvas.create_image(
+            c0 * self.cell_size, r0 * self.cell_size, anchor="nw",
+            image=load_scan_marker(kind, cells, self.cell_size), tags="scan_marker"
+        )
+        # Keep scan markers beneath the pooled target highlights
+        canvas.tag_lower("scan_marker", "target_hl")
+        return marker
     
     def show_detection_result(self, result):
         """Show visual result for EV detection (no specific coordinates - region detection only)."""
         # EV scans now only detect presence in region, not specific coordinates
-        # Show region-wide detection indicators instead of pinpoint markers
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show region scan indicator (not specific ship location)
-                detection_marker = self.ai_canvas.create_rectangle(
-                    cx - 20, cy - 20, cx + 20, cy + 20,
-                    outline="#00ff00", width=2, fill="", stipple="gray75"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'detection_markers'):
-                    self.detection_markers = []
-                self.detection_markers.append(detection_marker)
+        if result.get("region"):
+            # Show region scan indicator (not specific ship location)
+            self.detection_markers.append(self._draw_scan_marker("detected", result["region"]))
     
     def show_interaction_result(self, result):
         """Show visual result for EV interaction (region affected, not specific ships)."""
         # EV interaction affects region but doesn't pinpoint exact ship locations
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show interaction effect on region
-                interaction_mark = self.ai_canvas.create_oval(
-                    cx - 15, cy - 15, cx + 15, cy + 15,
-                    outline="#ffaa00", width=2, fill="", stipple="gray50"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'interaction_markers'):
-                    self.interaction_markers = []
-                self.interaction_markers.append(interaction_mark)
+        if result.get("region"):
+            self.interaction_markers.append(self._draw_scan_marker("interaction", result["region"]))
     
     def show_noise_result(self, result):
         """Show visual result for quantum noise in scanned region."""
         # EV noise affects entire scanned region, not specific coordinates
-        if "region" in result:
-            region = result["region"]
-            for row, col in region:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Show noise/static indicator across region
-                noise_marker = self.ai_canvas.create_rectangle(
-                    cx - 8, cy - 8, cx + 8, cy + 8,
-                    outline="#888888", width=1, fill="", stipple="gray25"
-                )
-                
-                # Store for cleanup
-                if not hasattr(self, 'noise_markers'):
-                    self.noise_markers = []
-                self.noise_markers.append(noise_marker)
+        if result.get("region"):
+            self.noise_markers.append(self._draw_scan_marker("noise", result["region"]))
     
     def show_miss_result(self, result):
         """Show visual result for a miss."""
         if "coords" in result and self.splash_img:
             miss_row, miss_col = result["coords"]
             if 0 <= miss_row < self.grid_size and 0 <= miss_col < self.grid_size:
-                if not self.ai_overlays[miss_row][miss_col]:
-                    cx = miss_col * self.cell_size + self.cell_size // 2
-                    cy = miss_row * self.cell_size + self.cell_size // 2
-                    splash_overlay = self.ai_canvas.create_image(cx, cy, image=self.splash_img)
-                    self.ai_overlays[miss_row][miss_col] = splash_overlay
+                k = self._i(miss_row, miss_col)
+                if not self.ai_overlays[k]:
+                    splash_overlay = self._ai_marks[k, 2]
+                    self.ai_canvas.itemconfigure(int(splash_overlay), state="normal")
+                    self.ai_overlays[k] = splash_overlay
         
     def ai_turn(self):
         """Execute AI's turn."""
         # Handle quantum protection expiration at start of AI turn
-        if hasattr(self, 'quantum_state'):
-            expired_positions = self.quantum_state.end_turn()
-            if expired_positions:
-                # Remove visual protection indicators for expired positions
-                for coords in expired_positions:
-                    self.remove_zeno_protection_visual(coords)
-        
-        # AI makes its move using quantum shots
-        ai_result = self.ai_player.make_move(self.player_controller)
+        expired_positions = self.quantum_state.end_turn()
+        if expired_positions:
+            # Remove visual protection indicators for expired positions
+            for coords in expired_positions:
+                self.remove_zeno_protection_visual(coords)
+        
+        # AI makes its move using quantum shots on a worker thread, so "AI IS THINKING..."
+        # actually renders and the window stays responsive while the simulator runs.
+        # Tk is not thread-safe, so the worker only posts to a queue that the main loop polls
+        worker = threading.Thread(
+            target=self._ai_worker, args=(self.ai_player, self.player_controller), daemon=True
+        )
+        worker.start()
+        if self._ai_poll_after is None:
+            self._ai_poll_after = self.root.after(self.AI_POLL_MS, self._poll_ai_move)
+    
+    def _ai_worker(self, ai_player, player_controller):
+        """Compute the AI move off the UI thread and hand it (or its error) to the main loop."""
+        try:
+            ai_result = ai_player.make_move(player_controller)
+        except Exception as e:
+            self._ai_moves.put((ai_player, None, e))
+        else:
+            self._ai_moves.put((ai_player, ai_result, None))
+    
+    def _poll_ai_move(self):
+        """Main-loop check for the AI worker's move; reschedules itself until it arrives."""
+        while True:
+            try:
+                ai_player, ai_result, error = self._ai_moves.get_nowait()
+            except queue.Empty:
+                self._ai_poll_after = self.root.after(self.AI_POLL_MS, self._poll_ai_move)
+                return
+            # Drop a move that finished after a new game was started
+            if ai_player is self.ai_player:
+                break
+        self._ai_poll_after = None
+        
+        if error is not None:
+            # Hand the turn back instead of leaving the game stuck on "AI IS THINKING..."
+            print(f"AI move failed: {error}")
+            self._show_banner(f"The AI could not complete its move ({error}). Your turn!")
+            self.player_turn = True
+            self.status_label.config(text="YOUR TURN - TARGET ENEMY FLEET")
+            return
         
         # Get the actual result from the AI's quantum shot
         shot_result = ai_result.get("result", {})
@@ -1326,39 +1335,18 @@ class SinglePlayerBattleshipUI:
     
     def animate_targeting_pattern(self, pattern, target_row, target_col, ai_result, shot_result):
         """Animate the targeting pattern on player's board."""
-        animation_cells = []
-        
-        # Define cells to highlight based on pattern
-        if pattern == "row":
-            # Highlight entire row
-            animation_cells = [(target_row, col) for col in range(self.grid_size)]
-        elif pattern == "column":
-            # Highlight entire column
-            animation_cells = [(row, target_col) for row in range(self.grid_size)]
-        elif pattern == "square":
-            # Highlight 2x2 area starting from target position (not centered around it)
-            for dr in range(2):
-                for dc in range(2):
-                    r, c = target_row + dr, target_col + dc
-                    if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
-                        animation_cells.append((r, c))
-        else:
-            # Single cell for easy/medium AI
-            animation_cells = [(target_row, target_col)]
+        # Easy/medium AI fire at one cell; skip the pulse and resolve the turn
+        if pattern == "single":
+            self.complete_ai_turn(ai_result, shot_result)
+            return
         
-        # Create yellow pulse animation
-        self.animation_overlays = []
-        for row, col in animation_cells:
-            if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
-                cx = col * self.cell_size + self.cell_size // 2
-                cy = row * self.cell_size + self.cell_size // 2
-                
-                # Create pulsing yellow overlay
-                overlay = self.player_canvas.create_rectangle(
-                    cx - 20, cy - 20, cx + 20, cy + 20,
-                    fill="#ffff00", outline="#ffaa00", width=2, stipple="gray25"
-                )
-                self.animation_overlays.append(overlay)
+        # Row, column and 2x2 (anchored at the target) cells come from the precomputed region table
+        animation_cells = self._region_table[(target_row, target_col, pattern)]
+        
+        # Yellow pulse animation, using the pooled "aianim" image
+        self._ai_pulse_span = self._show_pulse(
+            self.player_canvas, animation_cells, "#ffff00", "#ffaa00", 64, "aianim"
+        )
         
         # Start pulsing animation
         self.animation_step = 0
@@ -1367,24 +1355,20 @@ class SinglePlayerBattleshipUI:
     def pulse_animation(self, ai_result, shot_result):
         """Create pulsing effect for targeting animation."""
         if self.animation_step < 6:  # Pulse 3 times
-            # Alternate visibility
-            if self.animation_step % 2 == 0:
-                # Show overlays
-                for overlay in self.animation_overlays:
-                    self.player_canvas.itemconfig(overlay, state="normal")
-            else:
-                # Hide overlays
-                for overlay in self.animation_overlays:
-                    self.player_canvas.itemconfig(overlay, state="hidden")
+            # Alternate between the light and dense variant of the pulse image
+            rows, cols = self._ai_pulse_span
+            if rows:
+                alpha = 191 if self.animation_step % 2 else 64
+                self.player_canvas.itemconfigure(
+                    "aianim", image=load_pulse(rows, cols, self.cell_size, "#ffff00", "#ffaa00", alpha)
+                )
             
             self.animation_step += 1
             # Continue animation after 300ms
-            self.root.after(300, lambda: self.pulse_animation(ai_result, shot_result))
+            self._pulse_after = self.root.after(300, self.pulse_animation, ai_result, shot_result)
         else:
             # Animation complete - clean up and show result
-            for overlay in self.animation_overlays:
-                self.player_canvas.delete(overlay)
-            self.animation_overlays = []
+            self.player_canvas.itemconfigure("aianim", state="hidden")
             
             # Show the actual result after animation
             self.complete_ai_turn(ai_result, shot_result)
@@ -1400,20 +1384,9 @@ class SinglePlayerBattleshipUI:
             if shot_result.get("coords"):
                 hit_row, hit_col = shot_result["coords"]
                 if 0 <= hit_row < self.grid_size and 0 <= hit_col < self.grid_size:
-                    # Create a red X overlay on top of the ship
-                    cx = hit_col * self.cell_size + self.cell_size // 2
-                    cy = hit_row * self.cell_size + self.cell_size // 2
-                    
-                    # Draw red X
-                    x_size = 20
-                    x_mark1 = self.player_canvas.create_line(
-                        cx - x_size, cy - x_size, cx + x_size, cy + x_size,
-                        fill="#ff0000", width=4
-                    )
-                    x_mark2 = self.player_canvas.create_line(
-                        cx - x_size, cy + x_size, cx + x_size, cy - x_size,
-                        fill="#ff0000", width=4
-                    )
+                    # Reveal this cell's red X (pooled above its ship image)
+                    x_mark = self._player_marks[self._i(hit_row, hit_col), 1]
+                    self.player_canvas.itemconfigure(int(x_mark), state="normal")
         else:
             miss_pos = shot_result.get("coords", "unknown")
             message = f"Enemy missed! Shot at {miss_pos} found only water.\n\nAI Action: {ai_result.get('message', '')}"
@@ -1424,27 +1397,70 @@ class SinglePlayerBattleshipUI:
                 if 0 <= miss_row < self.grid_size and 0 <= miss_col < self.grid_size:
                     # Only show splash if it's not a ship location
                     if (miss_row, miss_col) not in self.placed_ships and self.splash_img:
-                        cx = miss_col * self.cell_size + self.cell_size // 2
-                        cy = miss_row * self.cell_size + self.cell_size // 2
-                        splash_overlay = self.player_canvas.create_image(cx, cy, image=self.splash_img)
+                        splash = self._player_marks[self._i(miss_row, miss_col), 2]
+                        self.player_canvas.itemconfigure(int(splash), state="normal")
         
-        messagebox.showinfo("AI Turn", message, parent=self.root)
-        
-        # Ensure window focus after dialog
-        self.root.lift()
-        self.root.focus_force()
+        self._show_banner(message)
         
         # Check if AI won
         if self.player_controller.is_game_won():
             messagebox.showinfo("DEFEAT!", "The AI destroyed your fleet! GAME OVER!", parent=self.root)
-            self.root.lift()
-            self.root.focus_force()
+            self._restore_focus()
             return
             
         # Player's turn again
         self.player_turn = True
         self.status_label.config(text="YOUR TURN - TARGET ENEMY FLEET")
         
+    def _restore_focus(self):
+        """Bring the main window back to the front after a dialog, once per idle pass."""
+        if self._focus_after is None:
+            self._focus_after = self.root.after_idle(self._raise_if_unfocused)
+    
+    def _raise_if_unfocused(self):
+        """Lift and focus the main window unless one of its widgets already has focus."""
+        self._focus_after = None
+        if self.root.focus_get() is None:
+            self.root.lift()
+            self.root.focus_force()
+    
+    def _show_banner(self, text):
+        """Show a non-modal banner over the boards that hides itself after a short delay."""
+        if self._banner is None:
+            self._banner = tk.Toplevel(self.root)
+            self._banner.overrideredirect(True)
+            self._banner.configure(bg="#1a1a2e")
+            self._banner_label = tk.Label(
+                self._banner,
+                font=("Helvetica", 12, "bold"),
+                bg="#1a1a2e",
+                fg="#ffffff",
+                justify="center",
+                wraplength=460,
+                padx=20,
+                pady=12
+            )
+            self._banner_label.pack()
+        
+        self._banner_label.config(text=text)
+        # A label's requested size is recomputed as soon as it is configured, so centre on it
+        # directly instead of flushing idle tasks (and every pending board redraw) mid-turn
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - self._banner_label.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + 80
+        self._banner.geometry(f"+{x}+{y}")
+        self._banner.deiconify()
+        self._banner.lift()
+        
+        # Restart the hide timer so back-to-back banners each get their full time
+        if self._banner_after:
+            self.root.after_cancel(self._banner_after)
+        self._banner_after = self.root.after(2500, self._hide_banner)
+    
+    def _hide_banner(self):
+        """Hide the banner."""
+        self._banner_after = None
+        self._banner.withdraw()
+        
     def new_game(self):
         """Start a new game."""
         # Reset game state
@@ -1454,7 +1470,7 @@ class SinglePlayerBattleshipUI:
         
         self.game_phase = "ship_placement"
         self.player_turn = True
-        self.placed_ships = []
+        self.placed_ships = set()
         self.selected_region = []
         
         # Reset UI
@@ -1473,28 +1489,40 @@ class SinglePlayerBattleshipUI:
         # Disable AI board
         self.ai_canvas.config(state="disabled")
         
-        # Clear all overlays
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if self.player_overlays[i][j]:
-                    self.player_canvas.delete(self.player_overlays[i][j])
-                    self.player_overlays[i][j] = None
-                if self.ai_overlays[i][j]:
-                    self.ai_canvas.delete(self.ai_overlays[i][j])
-                    self.ai_overlays[i][j] = None
-        
-        # Clear target highlights
-        if hasattr(self, 'target_highlights'):
-            for highlight in self.target_highlights.values():
-                if highlight:
-                    self.ai_canvas.delete(highlight)
-            self.target_highlights = {}
-        
-        # Redraw grids with fresh water backgrounds
-        self.player_canvas.delete("all")
-        self.ai_canvas.delete("all")
-        self.draw_player_grid()
-        self.draw_ai_grid()
+        # Forget board state; the pooled ship images are hidden with the other markers below
+        self.player_board.fill(0)
+        self.ai_overlays.fill(0)
+        
+        # Drop a highlight pass still waiting for idle time
+        if self._highlight_after:
+            self.root.after_cancel(self._highlight_after)
+            self._highlight_after = None
+        self._pending_highlight = None
+        
+        # Stop a targeting pulse from the old game before it reports its result
+        if self._pulse_after:
+            self.root.after_cancel(self._pulse_after)
+            self._pulse_after = None
+        
+        # Stop waiting for an AI move from the old game; a late result is dropped when polled
+        if self._ai_poll_after:
+            self.root.after_cancel(self._ai_poll_after)
+            self._ai_poll_after = None
+        self.player_canvas.itemconfigure("aianim", state="hidden")
+        self.ai_canvas.itemconfigure("playeranim", state="hidden")
+        
+        # Drop every remaining marker in one command per canvas;
+        # the board image and the marker/highlight pools ("board") are kept
+        self.player_canvas.delete("!board")
+        self.ai_canvas.delete("!board")
+        self.player_canvas.itemconfigure("mark", state="hidden")
+        self.ai_canvas.itemconfigure("mark", state="hidden")
+        self._clear_target_highlights()
+        self._clear_defense_highlights()
+        self.protection_visuals = {}
+        self.detection_markers = []
+        self.interaction_markers = []
+        self.noise_markers = []
 
 
 def main():